@@ -5,21 +5,31 @@ Endpoints for user registration, login, and profile management.
 All auth-related routes are here.
 """
 
-from typing import Optional, List
+from functools import partial
+from typing import Annotated, Optional, List
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, HTTPException, status, Depends
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
 
 from app.config.settings import settings
-from app.db.models import User, UserPublic, Meeting, Usage
+from app.db.models import User, UserPublic, Meeting, MeetingInDB
+from app.services import usage_cache
 from app.services.auth_service import (
-    hash_password,
-    verify_password,
+    ahash_password,
+    averify_password,
+    adummy_verify,
+    needs_rehash,
     create_access_token,
     get_current_user,
+    get_token_payload,
     require_auth,
+    security,
+    should_refresh_token,
 )
+from app.utils.response_utils import FastJSONResponse
+from app.utils.validation_utils import CachedEmailStr
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -29,30 +39,32 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 # Request/Response Models
 # ============================================
 
+# Names are stripped and length-checked inside pydantic-core (no Python validator)
+NameStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)]
+
+
 class RegisterRequest(BaseModel):
     """Registration request body."""
-    firstName: str = Field(..., min_length=1, max_length=50)
-    lastName: str = Field(..., min_length=1, max_length=50)
-    email: EmailStr
+    model_config = ConfigDict(extra="ignore")
+    
+    firstName: NameStr
+    lastName: NameStr
+    email: CachedEmailStr
     password: str = Field(..., min_length=6, max_length=100)
     confirmPassword: str = Field(..., min_length=6, max_length=100)
     
-    @field_validator("firstName", "lastName")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        return v.strip()
-    
-    @field_validator("confirmPassword")
-    @classmethod
-    def passwords_match(cls, v: str, info) -> str:
-        if "password" in info.data and v != info.data["password"]:
+    @model_validator(mode="after")
+    def passwords_match(self) -> "RegisterRequest":
+        if self.password != self.confirmPassword:
             raise ValueError("Passwords do not match")
-        return v
+        return self
 
 
 class LoginRequest(BaseModel):
     """Login request body."""
-    email: EmailStr
+    model_config = ConfigDict(extra="ignore")
+    
+    email: CachedEmailStr
     password: str
 
 
@@ -63,9 +75,32 @@ class AuthResponse(BaseModel):
     usage: dict  # { usedToday, dailyLimit }
 
 
+class GuestActionItem(BaseModel):
+    """Action item as stored client-side."""
+    model_config = ConfigDict(extra="ignore")
+    
+    description: str = ""
+    owner: Optional[str] = None
+
+
+class GuestMeeting(BaseModel):
+    """Guest meeting as stored client-side (LocalStorage)."""
+    model_config = ConfigDict(extra="ignore")
+    
+    fileName: str = "Unknown"
+    outputLanguage: str = "en"
+    summary: str = ""
+    transcriptRaw: str = ""
+    transcriptClean: str = ""
+    participants: List[str] = []
+    decisions: List[str] = []
+    actionItems: List[GuestActionItem] = []
+    createdAt: Optional[datetime] = None
+
+
 class MigrateMeetingsRequest(BaseModel):
     """Request to migrate guest meetings to user account."""
-    meetings: List[dict]
+    meetings: List[GuestMeeting]
 
 
 class UsageResponse(BaseModel):
@@ -75,6 +110,43 @@ class UsageResponse(BaseModel):
     canUse: bool
 
 
+# ============================================
+# Helpers
+# ============================================
+
+def _guest_meeting_to_doc(user_id: str, m: GuestMeeting) -> dict:
+    """Convert a guest (LocalStorage) meeting into a meetings document."""
+    return {
+        "userId": user_id,
+        "fileName": m.fileName,
+        "language": m.outputLanguage,
+        "summary": m.summary,
+        "transcript": m.transcriptRaw,
+        "transcriptClean": m.transcriptClean,
+        "participants": m.participants,
+        "decisions": m.decisions,
+        "actionItems": [ai.model_dump() for ai in m.actionItems],
+        "createdAt": m.createdAt or datetime.now(timezone.utc),
+    }
+
+
+def _meeting_to_frontend(m: MeetingInDB) -> dict:
+    """Convert a stored meeting into the frontend (LocalStorage) shape."""
+    return {
+        "id": m.id,
+        "fileName": m.fileName,
+        "outputLanguage": m.language,
+        "summary": m.summary,
+        "transcriptRaw": m.transcript,
+        "transcriptClean": m.transcriptClean,
+        "participants": m.participants,
+        "decisions": m.decisions,
+        "actionItems": [ai.model_dump() for ai in m.actionItems],
+        "createdAt": m.createdAt.isoformat(),
+        "exports": {"word": False, "pdf": False},  # Track client-side
+    }
+
+
 # ============================================
 # Routes
 # ============================================
@@ -95,8 +167,8 @@ async def register(body: RegisterRequest):
             detail="Email already registered",
         )
     
-    # Hash password
-    password_hash = hash_password(body.password)
+    # Hash password (CPU-bound KDF; run off the event loop)
+    password_hash = await ahash_password(body.password)
     
     # Create user
     user = await User.create(
@@ -116,9 +188,9 @@ async def register(body: RegisterRequest):
     token = create_access_token(user.id, user.email)
     
     # Get usage (will be 0 for new user)
-    used_today = await Usage.get(user.id)
+    used_today = await usage_cache.get_usage(user.id)
     
-    return AuthResponse(
+    return AuthResponse.model_construct(
         user=user,
         token=token,
         usage={
@@ -139,13 +211,16 @@ async def login(body: LoginRequest):
     # Find user
     user_db = await User.find_by_email(body.email)
     if user_db is None:
+        # Same KDF cost as a wrong password, so unknown emails aren't distinguishable by timing
+        await adummy_verify(body.password)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
     
-    # Verify password
-    if not verify_password(body.password, user_db.passwordHash):
+    # Verify password (CPU-bound KDF; run off the event loop)
+    password_ok = await averify_password(body.password, user_db.passwordHash)
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -154,6 +229,11 @@ async def login(body: LoginRequest):
     # Use string id everywhere for safe serialization
     user_id = str(user_db.id)
     
+    # Upgrade legacy (bcrypt) or outdated hashes now that we have the plaintext
+    if needs_rehash(user_db.passwordHash):
+        new_hash = await ahash_password(body.password)
+        await User.update_password_hash(user_id, new_hash)
+    
     # Update last login (non-blocking)
     await User.update_last_login(user_id)
     
@@ -161,20 +241,13 @@ async def login(body: LoginRequest):
     token = create_access_token(user_id, user_db.email)
     
     # Get usage
-    used_today = await Usage.get(user_id)
+    used_today = await usage_cache.get_usage(user_id)
     
-    # Build public user with explicit str/datetime for JSON
+    # Build public user from the already-validated DB model
     now_utc = datetime.now(timezone.utc)
-    user_public = UserPublic(
-        id=user_id,
-        firstName=user_db.firstName,
-        lastName=user_db.lastName,
-        email=user_db.email,
-        createdAt=user_db.createdAt,
-        lastLoginAt=now_utc,
-    )
+    user_public = user_db.to_public(last_login=now_utc)
     
-    return AuthResponse(
+    return AuthResponse.model_construct(
         user=user_public,
         token=token,
         usage={
@@ -185,20 +258,28 @@ async def login(body: LoginRequest):
 
 
 @router.get("/me", response_model=AuthResponse)
-async def get_me(user: UserPublic = Depends(require_auth)):
+async def get_me(
+    user: UserPublic = Depends(require_auth),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    payload: dict = Depends(get_token_payload),
+):
     """
     Get current user profile.
     
     Requires authentication.
     Returns user profile and current usage.
+    The incoming token is echoed back unless it is close to expiry,
+    in which case a fresh one is issued (sliding session).
     """
     # Get usage
-    used_today = await Usage.get(user.id)
+    used_today = await usage_cache.get_usage(user.id)
     
-    # Return fresh token for session extension
-    token = create_access_token(user.id, user.email)
+    if should_refresh_token(payload):
+        token = create_access_token(user.id, user.email)
+    else:
+        token = credentials.credentials
     
-    return AuthResponse(
+    return AuthResponse.model_construct(
         user=user,
         token=token,
         usage={
@@ -216,7 +297,7 @@ async def get_usage(user: Optional[UserPublic] = Depends(get_current_user)):
     Works for both authenticated and guest users.
     """
     if user:
-        used_today = await Usage.get(user.id)
+        used_today = await usage_cache.get_usage(user.id)
         limit = settings.registered_daily_limit
     else:
         # Guest - return 0, limit checking is done client-side
@@ -244,25 +325,7 @@ async def migrate_meetings(
         return {"migrated": 0}
     
     # Prepare meetings for insertion
-    docs = []
-    for m in body.meetings:
-        doc = {
-            "userId": user.id,
-            "fileName": m.get("fileName", "Unknown"),
-            "language": m.get("outputLanguage", "en"),
-            "summary": m.get("summary", ""),
-            "transcript": m.get("transcriptRaw", ""),
-            "transcriptClean": m.get("transcriptClean", ""),
-            "participants": m.get("participants", []),
-            "decisions": m.get("decisions", []),
-            "actionItems": [
-                {"description": ai.get("description", ""), "owner": ai.get("owner")}
-                for ai in m.get("actionItems", [])
-            ],
-            "createdAt": datetime.fromisoformat(m["createdAt"].replace("Z", "+00:00"))
-            if m.get("createdAt") else datetime.now(timezone.utc),
-        }
-        docs.append(doc)
+    docs = list(map(partial(_guest_meeting_to_doc, user.id), body.meetings))
     
     count = await Meeting.create_many(docs)
     
@@ -273,30 +336,31 @@ async def migrate_meetings(
 async def get_meetings(user: UserPublic = Depends(require_auth)):
     """
     Get all meetings for the authenticated user.
+    
+    List view: transcripts are omitted (empty strings); fetch
+    /meetings/{meeting_id} for the full meeting.
+    """
+    meetings = await Meeting.find_by_user_summary(user.id)
+    return FastJSONResponse({"meetings": meetings})
+
+
+@router.get("/meetings/{meeting_id}")
+async def get_meeting(
+    meeting_id: str,
+    user: UserPublic = Depends(require_auth),
+):
+    """
+    Get a single meeting including transcripts.
     """
-    meetings = await Meeting.find_by_user(user.id)
-    
-    # Convert to frontend format
-    result = []
-    for m in meetings:
-        result.append({
-            "id": m.id,
-            "fileName": m.fileName,
-            "outputLanguage": m.language,
-            "summary": m.summary,
-            "transcriptRaw": m.transcript,
-            "transcriptClean": m.transcriptClean,
-            "participants": m.participants,
-            "decisions": m.decisions,
-            "actionItems": [
-                {"description": ai.description, "owner": ai.owner}
-                for ai in m.actionItems
-            ],
-            "createdAt": m.createdAt.isoformat(),
-            "exports": {"word": False, "pdf": False},  # Track client-side
-        })
-    
-    return {"meetings": result}
+    m = await Meeting.get_full(meeting_id, user.id)
+    
+    if m is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found",
+        )
+    
+    return FastJSONResponse(_meeting_to_frontend(m))
 
 
 @router.delete("/meetings/{meeting_id}")
@@ -13,15 +13,27 @@ Usage tracking:
 - Guests: tracked client-side (LocalStorage)
 """
 
-from typing import Optional
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+import orjson
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel
 
 from app.config.settings import settings
-from app.db.models import Usage, UserPublic
-from app.models.schemas import APIResponse
-from app.services import document_service, pdf_service, summarization_service, transcription_service
+from app.db.models import UserPublic
+from app.models.schemas import APIResponse, JobResponse
+from app.services import (
+    document_service,
+    job_queue,
+    pdf_service,
+    summarization_service,
+    transcription_service,
+    usage_cache,
+)
 from app.services.auth_service import get_current_user
 from app.utils import file_utils
 
@@ -30,6 +42,18 @@ router = APIRouter(prefix=settings.normalized_api_prefix, tags=["api"])
 
 _SUPPORTED_LANGUAGES = frozenset({"he", "en", "fr", "es", "ar"})
 
+# Raw form value -> language code; exact and upper-case codes skip strip()/lower()
+_LANG_MAP = {
+    **{code: code for code in _SUPPORTED_LANGUAGES},
+    **{code.upper(): code for code in _SUPPORTED_LANGUAGES},
+}
+
+# Export format -> media type of the generated document
+_EXPORT_MEDIA_TYPES = {
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+
 
 def _validate_request(audio: UploadFile, language: str) -> str:
     """
@@ -42,8 +66,8 @@ def _validate_request(audio: UploadFile, language: str) -> str:
         HTTPException: If validation fails.
     """
     # Validate language
-    lang = language.strip().lower()
-    if lang not in _SUPPORTED_LANGUAGES:
+    lang = _LANG_MAP.get(language) or _LANG_MAP.get(language.strip().lower())
+    if lang is None:
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported language: {language}. Use one of: he, en, fr, es, ar.",
@@ -57,11 +81,14 @@ def _validate_request(audio: UploadFile, language: str) -> str:
     return lang
 
 
-async def _check_usage_limit(user: Optional[UserPublic]) -> None:
+@asynccontextmanager
+async def _reserved_usage(user: Optional[UserPublic]) -> AsyncIterator[Optional[str]]:
     """
-    Check if user has exceeded daily limit.
+    Consume one of the user's daily uses for the duration of the block.
     
-    For authenticated users, checks MongoDB.
+    For authenticated users the check and increment are a single atomic
+    MongoDB update; the use is refunded (on the day it was charged) if the
+    block raises. Yields that date, or None for guests.
     For guests, this is a no-op (limit checked client-side).
     
     Raises:
@@ -69,46 +96,81 @@ async def _check_usage_limit(user: Optional[UserPublic]) -> None:
     """
     if user is None:
         # Guest - limit enforced client-side
+        yield None
         return
     
-    # Authenticated user - check backend limit
-    can_use = await Usage.can_use(user.id, settings.registered_daily_limit)
-    if not can_use:
+    # Authenticated user - check and consume backend limit
+    usage_date = await usage_cache.reserve_usage(user.id, settings.registered_daily_limit)
+    if usage_date is None:
         raise HTTPException(
             status_code=429,
             detail=f"Daily limit reached. You can process {settings.registered_daily_limit} meetings per day.",
         )
+    try:
+        yield usage_date
+    except BaseException:
+        await usage_cache.release_usage(user.id, usage_date)
+        raise
 
 
-async def _increment_usage(user: Optional[UserPublic]) -> int:
+async def _save_upload(audio: UploadFile, dir: Optional[str] = None) -> str:
     """
-    Increment usage counter for authenticated users.
+    Stream the upload to a temp file and return its path.
     
-    Returns the new count.
+    Raises:
+        HTTPException: If the file is empty.
     """
-    if user is None:
-        return 0
+    suffix = file_utils.suffix_from_filename(audio.filename or "")
+    path = await file_utils.stream_upload_to_temp(audio, suffix, dir=dir)
+    if os.path.getsize(path) == 0:
+        file_utils.delete_temp_file(path)
+        raise HTTPException(status_code=400, detail="Empty file")
+    return path
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes (pydantic-core).
     
-    return await Usage.increment(user.id)
+    Returning a Response skips FastAPI's response_model re-validation, which
+    would walk the (multi-MB) transcript strings a second time. None fields
+    are omitted.
+    """
+    return Response(content=model.model_dump_json(exclude_none=True), media_type="application/json")
+
+
+def _attachment(content: bytes, export_format: str, lang: str) -> Response:
+    """Send an in-memory exported document as a download (language-aware filename)."""
+    filename = f"meeting_summary_{lang}.{export_format}"
+    return Response(
+        content=content,
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# Static payloads (depend only on settings), serialized once
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "environment": settings.app_env,
+    "api_prefix": settings.normalized_api_prefix or "(root)",
+})
+_SUPPORTED_FORMATS_BODY = orjson.dumps({
+    "formats": sorted(ext.lstrip(".") for ext in file_utils.ALLOWED_EXTENSIONS),
+    "description": file_utils.get_supported_formats_string(),
+})
 
 
 @router.get("/health")
-def health() -> dict[str, str]:
+async def health() -> Response:
     """Liveness check. Returns API status and configuration info."""
-    return {
-        "status": "ok",
-        "environment": settings.app_env,
-        "api_prefix": settings.normalized_api_prefix or "(root)",
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/supported-formats")
-def supported_formats() -> dict[str, list[str]]:
+async def supported_formats() -> Response:
     """Return list of supported audio formats."""
-    return {
-        "formats": sorted(ext.lstrip(".") for ext in file_utils.ALLOWED_EXTENSIONS),
-        "description": file_utils.get_supported_formats_string(),
-    }
+    return Response(content=_SUPPORTED_FORMATS_BODY, media_type="application/json")
 
 
 @router.post("/process-meeting", response_model=APIResponse)
@@ -116,7 +178,7 @@ async def process_meeting(
     audio: UploadFile = File(...),
     language: str = Form("en"),
     user: Optional[UserPublic] = Depends(get_current_user),
-) -> APIResponse:
+) -> Response:
     """
     Upload audio → transcribe (Whisper) → analyze (Claude) → return transcript + analysis.
 
@@ -133,35 +195,24 @@ async def process_meeting(
     """
     lang = _validate_request(audio, language)
     
-    # Check usage limit for authenticated users
-    await _check_usage_limit(user)
-    
-    data = await audio.read()
-    if not data:
-        raise HTTPException(status_code=400, detail="Empty file")
-
-    suffix = file_utils.suffix_from_filename(audio.filename or "")
-    path = file_utils.write_temp_audio(data, suffix)
-    try:
-        transcript = transcription_service.transcribe_audio(path)
-        analysis = summarization_service.analyze_transcript(transcript, lang)
-        
-        # Increment usage for authenticated users
-        await _increment_usage(user)
-        
-        # Return transcript for backward compatibility; analysis.raw_transcript is source of truth
-        return APIResponse(transcript=transcript, analysis=analysis)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except RuntimeError as e:
-        raise HTTPException(status_code=503, detail=str(e)) from e
-    finally:
-        file_utils.delete_temp_file(path)
+    async with _reserved_usage(user):
+        path = await _save_upload(audio)
+        try:
+            transcript = await transcription_service.transcribe_audio_async(path)
+            analysis = await summarization_service.analyze_transcript_async(transcript, lang)
+            
+            # Return transcript for backward compatibility; analysis.raw_transcript is source of truth
+            return _json_response(APIResponse(transcript=transcript, analysis=analysis))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except RuntimeError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        finally:
+            file_utils.delete_temp_file(path)
 
 
 @router.post("/process-meeting/export-docx")
 async def process_meeting_export_docx(
-    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     language: str = Form("en"),
     user: Optional[UserPublic] = Depends(get_current_user),
@@ -180,48 +231,24 @@ async def process_meeting_export_docx(
     """
     lang = _validate_request(audio, language)
     
-    # Check usage limit for authenticated users
-    await _check_usage_limit(user)
-    
-    data = await audio.read()
-    if not data:
-        raise HTTPException(status_code=400, detail="Empty file")
-
-    suffix = file_utils.suffix_from_filename(audio.filename or "")
-    path = file_utils.write_temp_audio(data, suffix)
-    docx_path = None
-    try:
-        transcript = transcription_service.transcribe_audio(path)
-        analysis = summarization_service.analyze_transcript(transcript, lang)
-        docx_path = document_service.generate_word_document(analysis, lang)
-        background_tasks.add_task(file_utils.delete_temp_file, docx_path)
-        
-        # Increment usage for authenticated users
-        await _increment_usage(user)
-        
-        # Language-aware filename
-        filename = f"meeting_summary_{lang}.docx"
-        
-        return FileResponse(
-            docx_path,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=filename,
-        )
-    except ValueError as e:
-        if docx_path:
-            file_utils.delete_temp_file(docx_path)
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except RuntimeError as e:
-        if docx_path:
-            file_utils.delete_temp_file(docx_path)
-        raise HTTPException(status_code=503, detail=str(e)) from e
-    finally:
-        file_utils.delete_temp_file(path)
+    async with _reserved_usage(user):
+        path = await _save_upload(audio)
+        try:
+            transcript = await transcription_service.transcribe_audio_async(path)
+            analysis = await summarization_service.analyze_transcript_async(transcript, lang)
+            # CPU-bound rendering; keep the event loop free for other requests
+            content = await asyncio.to_thread(document_service.render_word_document, analysis, lang)
+            return _attachment(content, "docx", lang)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except RuntimeError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        finally:
+            file_utils.delete_temp_file(path)
 
 
 @router.post("/process-meeting/export-pdf")
 async def process_meeting_export_pdf(
-    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     language: str = Form("en"),
     user: Optional[UserPublic] = Depends(get_current_user),
@@ -241,40 +268,107 @@ async def process_meeting_export_pdf(
     """
     lang = _validate_request(audio, language)
     
-    # Check usage limit for authenticated users
-    await _check_usage_limit(user)
+    async with _reserved_usage(user):
+        path = await _save_upload(audio)
+        try:
+            transcript = await transcription_service.transcribe_audio_async(path)
+            analysis = await summarization_service.analyze_transcript_async(transcript, lang)
+            # CPU-bound rendering; keep the event loop free for other requests
+            content = await asyncio.to_thread(pdf_service.render_pdf_document, analysis, lang)
+            return _attachment(content, "pdf", lang)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except RuntimeError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        finally:
+            file_utils.delete_temp_file(path)
+
+
+# ============================================
+# Background Jobs (arq worker, requires Redis)
+# ============================================
+
+@router.post("/process-meeting/jobs", response_model=JobResponse, status_code=202)
+async def submit_meeting_job(
+    audio: UploadFile = File(...),
+    language: str = Form("en"),
+    export: str = Form(""),
+    user: Optional[UserPublic] = Depends(get_current_user),
+) -> JobResponse:
+    """
+    Queue audio for background processing; returns a job_id immediately.
+
+    Same pipeline as /process-meeting (plus optional export: docx or pdf),
+    run by the worker. Poll /jobs/{job_id} for status and result; exported
+    documents are served from /jobs/{job_id}/download. Both only answer the
+    submitting user (or, for guest jobs, unauthenticated callers).
+    """
+    if not job_queue.is_enabled():
+        raise HTTPException(status_code=503, detail="Background jobs are not configured (REDIS_URL).")
     
-    data = await audio.read()
-    if not data:
-        raise HTTPException(status_code=400, detail="Empty file")
+    lang = _validate_request(audio, language)
+    export_format = export.strip().lower() or None
+    if export_format is not None and export_format not in _EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported export: {export}. Use docx or pdf.")
+    
+    # Consumed now; the worker refunds it if processing fails
+    async with _reserved_usage(user) as usage_date:
+        path = await _save_upload(audio, dir=job_queue.job_storage_dir())
+        try:
+            job_id = await job_queue.enqueue_meeting_job(
+                path, lang, export_format, user.id if user else None, usage_date
+            )
+        except Exception:
+            file_utils.delete_temp_file(path)
+            raise
+    
+    return JobResponse(job_id=job_id, status="queued")
 
-    suffix = file_utils.suffix_from_filename(audio.filename or "")
-    path = file_utils.write_temp_audio(data, suffix)
-    pdf_path = None
-    try:
-        transcript = transcription_service.transcribe_audio(path)
-        analysis = summarization_service.analyze_transcript(transcript, lang)
-        pdf_path = pdf_service.generate_pdf_document(analysis, lang)
-        background_tasks.add_task(file_utils.delete_temp_file, pdf_path)
-        
-        # Increment usage for authenticated users
-        await _increment_usage(user)
-        
-        # Language-aware filename
-        filename = f"meeting_summary_{lang}.pdf"
-        
-        return FileResponse(
-            pdf_path,
-            media_type="application/pdf",
-            filename=filename,
-        )
-    except ValueError as e:
-        if pdf_path:
-            file_utils.delete_temp_file(pdf_path)
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except RuntimeError as e:
-        if pdf_path:
-            file_utils.delete_temp_file(pdf_path)
-        raise HTTPException(status_code=503, detail=str(e)) from e
-    finally:
-        file_utils.delete_temp_file(path)
+
+async def _get_job_or_404(job_id: str, user: Optional[UserPublic]) -> dict:
+    """
+    Fetch job info or raise 404 (unknown, expired, jobs disabled, or not the
+    caller's: a user's jobs are only visible to them, guest jobs to guests).
+    """
+    info = await job_queue.get_job_info(job_id) if job_queue.is_enabled() else None
+    if info is None or info["user_id"] != (user.id if user else None):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return info
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job_status(
+    job_id: str,
+    user: Optional[UserPublic] = Depends(get_current_user),
+):
+    """Poll a background job. result is set once status is complete."""
+    info = await _get_job_or_404(job_id, user)
+    result = info["result"]
+    if result is None:
+        return JobResponse(job_id=job_id, status=info["status"], error=info["error"])
+    
+    return _json_response(JobResponse(
+        job_id=job_id,
+        status=info["status"],
+        result=APIResponse(transcript=result["transcript"], analysis=result["analysis"]),
+        download=result["file"] is not None,
+    ))
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_job_file(
+    job_id: str,
+    user: Optional[UserPublic] = Depends(get_current_user),
+):
+    """Download the document exported by a completed job."""
+    info = await _get_job_or_404(job_id, user)
+    result = info["result"]
+    if result is None or result["file"] is None or not os.path.exists(result["file"]):
+        raise HTTPException(status_code=404, detail="No document available for this job")
+    
+    export_format = result["filename"].rsplit(".", 1)[-1]
+    return FileResponse(
+        result["file"],
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        filename=result["filename"],
+    )
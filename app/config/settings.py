@@ -8,10 +8,10 @@ Single source of truth for config.
 Uses pydantic-settings for type-safe environment variable loading.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import List
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -20,8 +20,19 @@ class Settings(BaseSettings):
     
     All settings can be overridden via environment variables.
     Variable names are case-insensitive.
+    
+    Frozen after load so derived values can be cached (cached_property).
     """
     
+    model_config = SettingsConfigDict(
+        # Load from .env file
+        env_file=".env",
+        env_file_encoding="utf-8",
+        # Allow extra fields from environment
+        extra="ignore",
+        frozen=True,
+    )
+    
     # ---- Environment ----
     app_env: str = "development"
     
@@ -43,6 +54,11 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     anthropic_api_key: str = ""
     
+    # Concurrent Claude requests when analyzing the chunks of a long transcript
+    claude_max_concurrency: int = 8
+    # Retries (exponential backoff, honours Retry-After) on 429/5xx/connection errors
+    claude_max_retries: int = 4
+    
     # ---- Optional API Base URLs ----
     openai_base_url: str | None = None
     anthropic_base_url: str | None = None
@@ -51,11 +67,41 @@ class Settings(BaseSettings):
     # Connection URI (includes credentials)
     mongodb_uri: str = ""
     mongodb_db_name: str = "speechi"
+    # Connection pool (keep warm connections, cap concurrency)
+    mongo_min_pool: int = 10
+    mongo_max_pool: int = 50
+    mongo_max_idle_ms: int = 300000
+    
+    # ---- Redis (optional cache) ----
+    # Empty disables caching; reads fall through to MongoDB
+    redis_url: str = ""
+    # Analyses are cached by exact transcript + language for this long (0 disables)
+    analysis_cache_ttl_seconds: int = 86400
+    # Whisper transcripts are cached by exact audio content for this long (0 disables)
+    transcript_cache_ttl_seconds: int = 86400
+    
+    # ---- Background jobs (arq worker, requires Redis) ----
+    # Directory shared by API and worker for uploads/exports (empty = <tmp>/speechi-jobs)
+    job_storage_dir: str = ""
+    # How long job results and exported files are kept
+    job_result_ttl_seconds: int = 3600
+    # Concurrent jobs per worker process
+    worker_max_jobs: int = 4
     
     # ---- JWT Authentication ----
     jwt_secret_key: str = "CHANGE_ME_IN_PRODUCTION_USE_LONG_RANDOM_STRING"
     jwt_algorithm: str = "HS256"
     jwt_expire_days: int = 7
+    # /auth/me only re-issues a token when the current one expires within this window
+    jwt_refresh_threshold_seconds: int = 86400
+    # Verified tokens are cached in-process for this long (0 disables the cache)
+    jwt_cache_ttl_seconds: int = 60
+    jwt_cache_max_entries: int = 10000
+    
+    # ---- Password hashing (Argon2id) ----
+    # Higher = slower logins, stronger hashes. Existing hashes are upgraded on login.
+    argon2_time_cost: int = 3
+    argon2_memory_cost_kib: int = 65536
     
     # ---- Usage Limits ----
     guest_daily_limit: int = 1
@@ -66,7 +112,7 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return self.app_env.lower() == "production"
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """
         Parse CORS_ORIGINS env into a list. Never pass a raw string to allow_origins.
@@ -80,7 +126,7 @@ class Settings(BaseSettings):
             origins = [o for o in origins if o != "*"]
         return origins
     
-    @property
+    @cached_property
     def normalized_api_prefix(self) -> str:
         """
         Get normalized API prefix.
@@ -93,13 +139,6 @@ class Settings(BaseSettings):
         if not prefix.startswith("/"):
             prefix = "/" + prefix
         return prefix
-    
-    class Config:
-        # Load from .env file
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        # Allow extra fields from environment
-        extra = "ignore"
 
 
 @lru_cache
@@ -3,10 +3,15 @@ MongoDB connection management.
 
 Uses Motor for async MongoDB operations with FastAPI.
 Connection is lazily initialized and reused across requests.
+
+Optionally connects to Redis (REDIS_URL) for caching hot counters.
 """
 
+import asyncio
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+from redis.asyncio import Redis
 from typing import Optional
 
 from app.config.settings import settings
@@ -16,7 +21,10 @@ logger = logging.getLogger("speechi.db")
 
 # Global client instance
 _client: Optional[AsyncIOMotorClient] = None
-_database: Optional[AsyncIOMotorDatabase] = None
+# Database handle, set once by init_db. Read as connection.db (module attribute,
+# not `from ... import db`, which would bind the initial None).
+db: Optional[AsyncIOMotorDatabase] = None
+_redis: Optional[Redis] = None
 
 
 async def init_db() -> None:
@@ -26,7 +34,9 @@ async def init_db() -> None:
     Call this on application startup.
     Creates indexes for collections.
     """
-    global _client, _database
+    global _client, db
+    
+    await _init_redis()
     
     if not settings.mongodb_uri:
         logger.warning("[DB] MONGODB_URI not set, database features disabled")
@@ -36,8 +46,13 @@ async def init_db() -> None:
         _client = AsyncIOMotorClient(
             settings.mongodb_uri,
             serverSelectionTimeoutMS=5000,
+            minPoolSize=settings.mongo_min_pool,
+            maxPoolSize=settings.mongo_max_pool,
+            maxIdleTimeMS=settings.mongo_max_idle_ms,
+            waitQueueTimeoutMS=5000,
+            retryWrites=True,
         )
-        _database = _client[settings.mongodb_db_name]
+        db = _client[settings.mongodb_db_name]
         
         # Test connection
         await _client.admin.command("ping")
@@ -49,25 +64,52 @@ async def init_db() -> None:
     except Exception as e:
         logger.error("[DB] Failed to connect to MongoDB: %s", e)
         _client = None
-        _database = None
+        db = None
 
 
-async def _create_indexes() -> None:
-    """Create necessary indexes for collections."""
-    if _database is None:
+async def _init_redis() -> None:
+    """Connect to Redis if REDIS_URL is set. Cache stays disabled on failure."""
+    global _redis
+    
+    if not settings.redis_url:
+        logger.info("[DB] REDIS_URL not set, usage cache disabled")
         return
     
-    # Users collection: unique email index
-    await _database.users.create_index("email", unique=True)
-    logger.debug("[DB] Created index: users.email (unique)")
+    try:
+        _redis = Redis.from_url(settings.redis_url, decode_responses=True)
+        await _redis.ping()
+        logger.info("[DB] Connected to Redis")
+    except Exception as e:
+        logger.error("[DB] Failed to connect to Redis: %s", e)
+        _redis = None
+
+
+async def _create_indexes() -> None:
+    """Create necessary indexes for collections (concurrently, one round-trip each)."""
+    if db is None:
+        return
     
-    # Meetings collection: userId index for queries
-    await _database.meetings.create_index("userId")
-    logger.debug("[DB] Created index: meetings.userId")
+    await asyncio.gather(
+        # Users collection: unique email index
+        db.users.create_index("email", unique=True),
+        # Meetings collection: per-user listing sorted newest first
+        # (its userId prefix also serves plain userId lookups)
+        db.meetings.create_index([("userId", 1), ("createdAt", -1)]),
+        # Usage collection: compound index for userId + date
+        db.usage.create_index([("userId", 1), ("date", 1)], unique=True),
+    )
+    logger.debug(
+        "[DB] Created indexes: users.email (unique), meetings.userId_createdAt, "
+        "usage.userId_date (unique)"
+    )
     
-    # Usage collection: compound index for userId + date
-    await _database.usage.create_index([("userId", 1), ("date", 1)], unique=True)
-    logger.debug("[DB] Created index: usage.userId_date (unique)")
+    # Superseded by meetings.userId_createdAt; existing deployments still
+    # have it, and every meeting insert would keep paying to maintain it
+    try:
+        await db.meetings.drop_index("userId_1")
+        logger.info("[DB] Dropped redundant index meetings.userId_1")
+    except OperationFailure:
+        pass  # Already gone (or never created)
 
 
 async def close_db() -> None:
@@ -76,14 +118,19 @@ async def close_db() -> None:
     
     Call this on application shutdown.
     """
-    global _client, _database
+    global _client, db, _redis
     
     if _client:
         _client.close()
         logger.info("[DB] MongoDB connection closed")
     
+    if _redis is not None:
+        await _redis.aclose()
+        logger.info("[DB] Redis connection closed")
+    
     _client = None
-    _database = None
+    db = None
+    _redis = None
 
 
 def get_database() -> Optional[AsyncIOMotorDatabase]:
@@ -92,9 +139,18 @@ def get_database() -> Optional[AsyncIOMotorDatabase]:
     
     Returns None if not connected.
     """
-    return _database
+    return db
+
+
+def get_redis() -> Optional[Redis]:
+    """
+    Get the Redis client.
+    
+    Returns None if REDIS_URL is unset or Redis is unreachable.
+    """
+    return _redis
 
 
 def is_connected() -> bool:
     """Check if database is connected."""
-    return _database is not None
+    return db is not None
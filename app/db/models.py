@@ -5,12 +5,16 @@ Defines the structure of documents in each collection
 and provides typed operations for CRUD.
 """
 
+import re
+import time
 from datetime import datetime, timezone
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from .connection import get_database
+from . import connection
 
 
 # ============================================
@@ -18,6 +22,14 @@ from .connection import get_database
 # ============================================
 # Use str for MongoDB _id in Pydantic models (we pass str(doc["_id"]) when building).
 # PyObjectId was removed to avoid Pydantic v2 validator signature mismatch.
+# Ids are plain str and datetimes serialize as ISO-8601 by default, so no
+# json_encoders are needed.
+
+# Valid ObjectId hex string; malformed ids are rejected before any DB call
+_OID_RE = re.compile(r"[0-9a-fA-F]{24}")
+
+# Read-only DB models: immutable, unknown document keys ignored
+_DB_MODEL_CONFIG = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
 
 class UserInDB(BaseModel):
@@ -30,23 +42,52 @@ class UserInDB(BaseModel):
     createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     lastLoginAt: Optional[datetime] = None
     
-    class Config:
-        populate_by_name = True
-        json_encoders = {ObjectId: str, datetime: lambda v: v.isoformat()}
+    model_config = _DB_MODEL_CONFIG
+    
+    def to_public(self, *, last_login: Optional[datetime] = None) -> "UserPublic":
+        """Public view of this user (fields already validated, no re-validation)."""
+        return UserPublic.model_construct(
+            id=self.id,
+            firstName=self.firstName,
+            lastName=self.lastName,
+            email=self.email,
+            createdAt=self.createdAt,
+            lastLoginAt=last_login or self.lastLoginAt,
+        )
 
 
 class UserPublic(BaseModel):
     """User data safe to return to frontend (no password)."""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     firstName: str
     lastName: str
     email: str
     createdAt: datetime
     lastLoginAt: Optional[datetime] = None
+    
+    @classmethod
+    def from_db(cls, doc: dict, *, last_login: Optional[datetime] = None) -> "UserPublic":
+        """
+        Build from a raw users document without validation.
+        
+        Documents were validated on write, so model_construct is safe here.
+        """
+        return cls.model_construct(
+            id=str(doc["_id"]),
+            firstName=doc["firstName"],
+            lastName=doc["lastName"],
+            email=doc["email"],
+            createdAt=doc["createdAt"],
+            lastLoginAt=last_login or doc.get("lastLoginAt"),
+        )
 
 
 class ActionItemInDB(BaseModel):
     """Action item sub-document."""
+    model_config = _DB_MODEL_CONFIG
+    
     description: str
     owner: Optional[str] = None
 
@@ -65,9 +106,35 @@ class MeetingInDB(BaseModel):
     actionItems: List[ActionItemInDB] = []
     createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
-    class Config:
-        populate_by_name = True
-        json_encoders = {ObjectId: str, datetime: lambda v: v.isoformat()}
+    model_config = _DB_MODEL_CONFIG
+    
+    @classmethod
+    def from_db(cls, doc: dict) -> "MeetingInDB":
+        """
+        Build from a raw meetings document without validation.
+        
+        Documents were written by Meeting.create/create_many, so
+        model_construct is safe here (validate on write, not on load).
+        """
+        return cls.model_construct(
+            id=str(doc["_id"]),
+            userId=doc["userId"],
+            fileName=doc["fileName"],
+            language=doc["language"],
+            summary=doc["summary"],
+            transcript=doc.get("transcript", ""),
+            transcriptClean=doc.get("transcriptClean", ""),
+            participants=doc.get("participants", []),
+            decisions=doc.get("decisions", []),
+            actionItems=[
+                ActionItemInDB.model_construct(
+                    description=ai.get("description", ""),
+                    owner=ai.get("owner"),
+                )
+                for ai in doc.get("actionItems", [])
+            ],
+            createdAt=doc["createdAt"],
+        )
 
 
 class UsageInDB(BaseModel):
@@ -77,9 +144,7 @@ class UsageInDB(BaseModel):
     date: str  # "YYYY-MM-DD" format
     count: int = 0
     
-    class Config:
-        populate_by_name = True
-        json_encoders = {ObjectId: str}
+    model_config = _DB_MODEL_CONFIG
 
 
 # ============================================
@@ -96,44 +161,40 @@ class User:
         email: str,
         password_hash: str,
     ) -> Optional[UserPublic]:
-        """Create a new user. Returns None if email already exists."""
-        db = get_database()
+        """
+        Create a new user. Returns None if email already exists.
+        
+        email must already be normalized (see validation_utils.normalize_email).
+        """
+        db = connection.db
         if db is None:
             return None
         
         doc = {
             "firstName": first_name,
             "lastName": last_name,
-            "email": email.lower(),
+            "email": email,
             "passwordHash": password_hash,
             "createdAt": datetime.now(timezone.utc),
             "lastLoginAt": None,
         }
         
         try:
-            result = await db.users.insert_one(doc)
-            return UserPublic(
-                id=str(result.inserted_id),
-                firstName=first_name,
-                lastName=last_name,
-                email=email.lower(),
-                createdAt=doc["createdAt"],
-                lastLoginAt=None,
-            )
-        except Exception as e:
-            # Duplicate key error if email exists
-            if "duplicate key" in str(e).lower():
-                return None
-            raise
+            await db.users.insert_one(doc)
+        except DuplicateKeyError:
+            # Email exists (unique users.email index)
+            return None
+        # insert_one sets doc["_id"]
+        return UserPublic.from_db(doc)
     
     @staticmethod
     async def find_by_email(email: str) -> Optional[UserInDB]:
-        """Find user by email."""
-        db = get_database()
+        """Find user by email (already normalized, see validation_utils.normalize_email)."""
+        db = connection.db
         if db is None:
             return None
         
-        doc = await db.users.find_one({"email": email.lower()})
+        doc = await db.users.find_one({"email": email})
         if doc is None:
             return None
         
@@ -150,46 +211,60 @@ class User:
     @staticmethod
     async def find_by_id(user_id: str) -> Optional[UserPublic]:
         """Find user by ID."""
-        db = get_database()
+        db = connection.db
         if db is None:
             return None
         
-        try:
-            doc = await db.users.find_one({"_id": ObjectId(user_id)})
-            if doc is None:
-                return None
-            
-            return UserPublic(
-                id=str(doc["_id"]),
-                firstName=doc["firstName"],
-                lastName=doc["lastName"],
-                email=doc["email"],
-                createdAt=doc["createdAt"],
-                lastLoginAt=doc.get("lastLoginAt"),
-            )
-        except Exception:
+        if not _OID_RE.fullmatch(user_id):
+            return None
+        
+        doc = await db.users.find_one({"_id": ObjectId(user_id)})
+        if doc is None:
             return None
+        
+        return UserPublic.from_db(doc)
     
     @staticmethod
     async def update_last_login(user_id: str) -> None:
         """Update user's last login timestamp."""
-        db = get_database()
+        db = connection.db
         if db is None:
             return
         
-        try:
-            await db.users.update_one(
-                {"_id": ObjectId(user_id)},
-                {"$set": {"lastLoginAt": datetime.now(timezone.utc)}}
-            )
-        except Exception:
-            pass
+        if not _OID_RE.fullmatch(user_id):
+            return
+        
+        await db.users.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$set": {"lastLoginAt": datetime.now(timezone.utc)}}
+        )
+    
+    @staticmethod
+    async def update_password_hash(user_id: str, password_hash: str) -> None:
+        """Replace the stored password hash (e.g. bcrypt → Argon2id upgrade)."""
+        db = connection.db
+        if db is None:
+            return
+        
+        if not _OID_RE.fullmatch(user_id):
+            return
+        
+        await db.users.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$set": {"passwordHash": password_hash}}
+        )
 
 
 # ============================================
 # Meeting Operations
 # ============================================
 
+# Projection for list views: drop the (potentially large) transcript fields
+_NO_TRANSCRIPTS = {"transcript": 0, "transcriptClean": 0}
+
+# Documents per insert_many call in bulk ingest
+_INSERT_BATCH = 100
+
 class Meeting:
     """Meeting collection operations."""
     
@@ -206,7 +281,7 @@ class Meeting:
         action_items: List[dict],
     ) -> Optional[str]:
         """Create a new meeting. Returns meeting ID."""
-        db = get_database()
+        db = connection.db
         if db is None:
             return None
         
@@ -228,60 +303,131 @@ class Meeting:
     
     @staticmethod
     async def create_many(meetings: List[dict]) -> int:
-        """Bulk create meetings. Returns count created."""
-        db = get_database()
+        """
+        Bulk create meetings in unordered insert_many batches of _INSERT_BATCH.
+        
+        Unordered lets the server apply inserts in parallel and keeps going
+        past individual failures.
+        
+        Returns count created.
+        """
+        db = connection.db
         if db is None or not meetings:
             return 0
         
-        result = await db.meetings.insert_many(meetings)
-        return len(result.inserted_ids)
+        inserted = 0
+        for start in range(0, len(meetings), _INSERT_BATCH):
+            batch = meetings[start:start + _INSERT_BATCH]
+            try:
+                result = await db.meetings.insert_many(
+                    batch,
+                    ordered=False,
+                    bypass_document_validation=True,
+                )
+                inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get("nInserted", 0)
+        return inserted
     
     @staticmethod
-    async def find_by_user(user_id: str, limit: int = 100) -> List[MeetingInDB]:
-        """Get all meetings for a user, newest first."""
-        db = get_database()
+    async def find_by_user(
+        user_id: str,
+        limit: int = 100,
+        include_transcripts: bool = False,
+    ) -> List[MeetingInDB]:
+        """
+        Get all meetings for a user, newest first.
+        
+        Transcripts are projected out (left as "") unless include_transcripts.
+        """
+        db = connection.db
+        if db is None:
+            return []
+        
+        projection = None if include_transcripts else _NO_TRANSCRIPTS
+        cursor = (
+            db.meetings.find({"userId": user_id}, projection)
+            .sort("createdAt", -1)
+            .limit(limit)
+            .batch_size(limit)
+        )
+        docs = await cursor.to_list(length=limit)
+        return [MeetingInDB.from_db(doc) for doc in docs]
+    
+    @staticmethod
+    async def find_by_user_summary(user_id: str, limit: int = 100) -> List[dict]:
+        """
+        Get a user's meetings for list views, newest first.
+        
+        Transcripts are projected out server-side and documents are emitted
+        already in frontend shape (see get_full for the transcripts).
+        """
+        db = connection.db
         if db is None:
             return []
         
-        cursor = db.meetings.find({"userId": user_id}).sort("createdAt", -1).limit(limit)
-        results = []
-        async for doc in cursor:
-            results.append(MeetingInDB(
-                _id=str(doc["_id"]),
-                userId=doc["userId"],
-                fileName=doc["fileName"],
-                language=doc["language"],
-                summary=doc["summary"],
-                transcript=doc["transcript"],
-                transcriptClean=doc.get("transcriptClean", ""),
-                participants=doc.get("participants", []),
-                decisions=doc.get("decisions", []),
-                actionItems=[
-                    ActionItemInDB(
-                        description=ai.get("description", ""),
-                        owner=ai.get("owner")
-                    )
-                    for ai in doc.get("actionItems", [])
-                ],
-                createdAt=doc["createdAt"],
-            ))
-        return results
+        cursor = db.meetings.aggregate([
+            {"$match": {"userId": user_id}},
+            {"$sort": {"createdAt": -1}},
+            {"$limit": limit},
+            {"$project": {
+                "_id": 0,
+                "id": {"$toString": "$_id"},
+                "fileName": 1,
+                "outputLanguage": "$language",
+                "summary": 1,
+                "transcriptRaw": {"$literal": ""},
+                "transcriptClean": {"$literal": ""},
+                "participants": {"$ifNull": ["$participants", []]},
+                "decisions": {"$ifNull": ["$decisions", []]},
+                "actionItems": {"$map": {
+                    "input": {"$ifNull": ["$actionItems", []]},
+                    "as": "ai",
+                    "in": {
+                        "description": {"$ifNull": ["$$ai.description", ""]},
+                        "owner": {"$ifNull": ["$$ai.owner", None]},
+                    },
+                }},
+                "createdAt": 1,
+                "exports": {"$literal": {"word": False, "pdf": False}},
+            }},
+        ], batchSize=limit)
+        return await cursor.to_list(length=limit)
+    
+    @staticmethod
+    async def get_full(meeting_id: str, user_id: str) -> Optional[MeetingInDB]:
+        """Get a single meeting including transcripts. None if not found."""
+        db = connection.db
+        if db is None:
+            return None
+        
+        if not _OID_RE.fullmatch(meeting_id):
+            return None
+        
+        doc = await db.meetings.find_one({
+            "_id": ObjectId(meeting_id),
+            "userId": user_id,
+        })
+        if doc is None:
+            return None
+        
+        return MeetingInDB.from_db(doc)
     
     @staticmethod
     async def delete(meeting_id: str, user_id: str) -> bool:
         """Delete a meeting. Returns True if deleted."""
-        db = get_database()
+        db = connection.db
         if db is None:
             return False
         
-        try:
-            result = await db.meetings.delete_one({
-                "_id": ObjectId(meeting_id),
-                "userId": user_id,
-            })
-            return result.deleted_count > 0
-        except Exception:
+        if not _OID_RE.fullmatch(meeting_id):
             return False
+        
+        result = await db.meetings.delete_one({
+            "_id": ObjectId(meeting_id),
+            "userId": user_id,
+        })
+        return result.deleted_count > 0
 
 
 # ============================================
@@ -291,15 +437,23 @@ class Meeting:
 class Usage:
     """Usage tracking operations."""
     
+    # (epoch day, "YYYY-MM-DD") for the current UTC day
+    _today: tuple[int, str] = (-1, "")
+    
     @staticmethod
     def _get_today() -> str:
-        """Get today's date string."""
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        """Get today's date string (UTC), re-formatted only when the day changes."""
+        day = int(time.time()) // 86400
+        cached_day, date_str = Usage._today
+        if day != cached_day:
+            date_str = datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%d")
+            Usage._today = (day, date_str)
+        return date_str
     
     @staticmethod
     async def get(user_id: str) -> int:
         """Get usage count for today."""
-        db = get_database()
+        db = connection.db
         if db is None:
             return 0
         
@@ -313,7 +467,7 @@ class Usage:
     @staticmethod
     async def increment(user_id: str) -> int:
         """Increment usage count for today. Returns new count."""
-        db = get_database()
+        db = connection.db
         if db is None:
             return 0
         
@@ -323,7 +477,7 @@ class Usage:
             {"userId": user_id, "date": today},
             {"$inc": {"count": 1}},
             upsert=True,
-            return_document=True,
+            return_document=ReturnDocument.AFTER,
         )
         
         return result["count"] if result else 1
@@ -333,3 +487,60 @@ class Usage:
         """Check if user can make another request."""
         current = await Usage.get(user_id)
         return current < limit
+    
+    @staticmethod
+    async def check_and_increment(user_id: str, limit: int) -> Optional[tuple[int, str]]:
+        """
+        Atomically consume one use if under the limit (single round-trip).
+        
+        Returns (new count, date charged), or None if the limit is already
+        reached. Pass the date to decrement to refund this use.
+        
+        A DuplicateKeyError means the upsert tried to insert a second
+        (userId, date) document: either the count is at the limit (filter
+        didn't match), or a concurrent first use of the day inserted it
+        first. Retrying without upsert tells the two apart.
+        """
+        today = Usage._get_today()
+        db = connection.db
+        if db is None:
+            return 0, today
+        
+        query = {"userId": user_id, "date": today, "count": {"$lt": limit}}
+        try:
+            result = await db.usage.find_one_and_update(
+                query,
+                {"$inc": {"count": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # The document exists now; consume only if still under the limit
+            result = await db.usage.find_one_and_update(
+                query,
+                {"$inc": {"count": 1}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if result is None:
+                return None
+        
+        return result["count"], today
+    
+    @staticmethod
+    async def decrement(user_id: str, date: str) -> Optional[int]:
+        """
+        Give back one use charged on date (e.g. processing failed after
+        check_and_increment), even if the UTC day has changed since.
+        
+        Returns the new count, or None if there was nothing to refund.
+        """
+        db = connection.db
+        if db is None:
+            return None
+        
+        result = await db.usage.find_one_and_update(
+            {"userId": user_id, "date": date, "count": {"$gt": 0}},
+            {"$inc": {"count": -1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return result["count"] if result else None
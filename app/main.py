@@ -5,26 +5,38 @@ Wire up routers, middleware, and lifecycle hooks.
 Serves as the single ASGI application for the meeting transcription backend.
 
 CORS: Configured via CORS_ORIGINS env, applied before any route.
-Middleware order: logging (innermost) then CORS (outermost) so all responses get CORS headers.
+Middleware order: logging (innermost, dev only) then CORS (outermost) so all responses get CORS headers.
 """
 
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from app.api.auth_routes import router as auth_router
+from app.api.routes import router as api_router
 from app.config.settings import settings
 from app.db.connection import init_db, close_db
+from app.services import job_queue, pdf_service
 
 logger = logging.getLogger("speechi")
-# Ensure request log lines appear (e.g. [REQ] OPTIONS /auth/login, [RES] 200)
+# Ensure log lines appear (e.g. [REQ] OPTIONS /auth/login, [RES] 200).
+# Records go through a queue; a background listener thread does the stream I/O,
+# so logging never blocks the event loop.
 if not logger.handlers:
     handler = logging.StreamHandler()
     handler.setFormatter(logging.Formatter("%(message)s"))
-    logger.addHandler(handler)
+    _log_listener = QueueListener(queue.SimpleQueue(), handler)
+    logger.addHandler(QueueHandler(_log_listener.queue))
     logger.setLevel(logging.INFO)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 
 @asynccontextmanager
@@ -33,14 +45,19 @@ async def lifespan(app: FastAPI):
     Application lifespan handler.
     Manages startup and shutdown events.
     """
-    logger.info("=" * 50)
-    logger.info("[Speechi API] Starting up...")
-    logger.info("[Speechi API] Environment: %s", settings.app_env)
-    logger.info("[Speechi API] API prefix: %s", settings.normalized_api_prefix or "(root)")
-    if not settings.is_production:
-        # Only log CORS origins in development (avoid leaking config in prod logs)
-        logger.info("[Speechi API] CORS origins: %s", settings.cors_origins_list)
-    logger.info("[Speechi API] Server: %s:%s", settings.app_host, settings.app_port)
+    if settings.is_production:
+        logger.info("[Speechi API] Starting up (%s)", settings.app_env)
+    else:
+        # One pre-formatted write instead of a log call per line
+        logger.info("\n".join((
+            "=" * 50,
+            "[Speechi API] Starting up...",
+            f"[Speechi API] Environment: {settings.app_env}",
+            f"[Speechi API] API prefix: {settings.normalized_api_prefix or '(root)'}",
+            f"[Speechi API] CORS origins: {settings.cors_origins_list}",
+            f"[Speechi API] Server: {settings.app_host}:{settings.app_port}",
+            "=" * 50,
+        )))
     
     # Security check: fail fast if using default JWT secret in production
     if settings.is_production and "CHANGE_ME" in settings.jwt_secret_key:
@@ -49,80 +66,111 @@ async def lifespan(app: FastAPI):
             "Generate one with: openssl rand -hex 32"
         )
     
+    pdf_service.warm_up()
     await init_db()
-    logger.info("=" * 50)
     yield
     logger.info("[Speechi API] Shutting down...")
+    await job_queue.close_pool()
     await close_db()
 
 
-# Create app first; middleware and routes are added below in correct order.
-app = FastAPI(
-    title="Speechi - Meeting Transcription & Summarization API",
-    description="Audio → Whisper → Claude → JSON (optional Word/PDF). Includes user authentication.",
-    version="0.2.0",
-    lifespan=lifespan,
-    docs_url="/docs" if not settings.is_production else None,
-    redoc_url="/redoc" if not settings.is_production else None,
-)
+# Request logging (development only). In production use uvicorn's access log instead.
+# Liveness pings are not logged.
+_UNLOGGED_PATHS = frozenset({"/", f"{settings.normalized_api_prefix}/health"})
+
 
-# 1) Request logging middleware (innermost) – runs first on request, last on response
-@app.middleware("http")
 async def log_requests(request: Request, call_next):
+    if request.url.path in _UNLOGGED_PATHS:
+        return await call_next(request)
     logger.info("[REQ] %s %s", request.method, request.url)
     response = await call_next(request)
     logger.info("[RES] %s", response.status_code)
     return response
 
-# 2) CORS middleware (outermost) – MUST be registered before routers so all responses get CORS headers.
-#    Parsed from ENV: CORS_ORIGINS is split into a list; never pass a raw string to allow_origins.
-#    allow_credentials=True requires frontend to use credentials: "include" for cross-origin.
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
-)
-
-# 3) Global exception handler – ensures 500 responses are JSON and still go through CORS
-@app.exception_handler(Exception)
+
 async def global_exception_handler(request: Request, exc: Exception):
+    """Ensure 500 responses are JSON and still go through CORS."""
     logger.exception("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
 
-# 4) Root endpoint (no prefix)
-@app.get("/", include_in_schema=False)
+
+# Root payload depends only on settings, so it is serialized once.
+_ROOT_BODY = orjson.dumps({
+    "service": "Speechi API",
+    "version": "0.2.0",
+    "status": "ok",
+    "docs": "/docs" if not settings.is_production else None,
+    "api_prefix": settings.normalized_api_prefix or "(root)",
+    "endpoints": {
+        "health": f"{settings.normalized_api_prefix}/health",
+        "process_meeting": f"{settings.normalized_api_prefix}/process-meeting",
+        "auth_register": f"{settings.normalized_api_prefix}/auth/register",
+        "auth_login": f"{settings.normalized_api_prefix}/auth/login",
+        "auth_me": f"{settings.normalized_api_prefix}/auth/me",
+    },
+})
+
+
 async def root():
-    prefix = settings.normalized_api_prefix
-    return JSONResponse(
-        content={
-            "service": "Speechi API",
-            "version": "0.2.0",
-            "status": "ok",
-            "docs": "/docs" if not settings.is_production else None,
-            "api_prefix": prefix or "(root)",
-            "endpoints": {
-                "health": f"{prefix}/health",
-                "process_meeting": f"{prefix}/process-meeting",
-                "auth_register": f"{prefix}/auth/register",
-                "auth_login": f"{prefix}/auth/login",
-                "auth_me": f"{prefix}/auth/me",
-            },
-        }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application.
+    
+    Middleware and routes are added in this order so every response
+    (including errors) gets CORS headers.
+    """
+    app = FastAPI(
+        title="Speechi - Meeting Transcription & Summarization API",
+        description="Audio → Whisper → Claude → JSON (optional Word/PDF). Includes user authentication.",
+        version="0.2.0",
+        lifespan=lifespan,
+        docs_url="/docs" if not settings.is_production else None,
+        redoc_url="/redoc" if not settings.is_production else None,
+    )
+    
+    # 1) Request logging middleware (innermost, development only) – runs first on request,
+    #    last on response.
+    if not settings.is_production:
+        app.middleware("http")(log_requests)
+    
+    # 2) CORS middleware (outermost) – MUST be registered before routers so all responses get CORS headers.
+    #    Parsed from ENV: CORS_ORIGINS is split into a list; never pass a raw string to allow_origins.
+    #    allow_credentials=True requires frontend to use credentials: "include" for cross-origin.
+    #    Explicit method/header lists (no "*"); being outermost, CORS answers preflights
+    #    before the logging middleware sees them.
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins_list,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization", "Accept"],
+        # Filename of Word/PDF downloads
+        expose_headers=["Content-Disposition"],
+        # Let browsers cache preflight results (capped by the browser, e.g. 2h in Chromium)
+        max_age=86400,
     )
+    
+    # 3) Global exception handler
+    app.add_exception_handler(Exception, global_exception_handler)
+    
+    # 4) Root endpoint (no prefix)
+    app.add_api_route("/", root, methods=["GET"], include_in_schema=False)
+    
+    # 5) Include routers ONLY after CORS and middleware. Paths match frontend:
+    #    API_PREFIX empty => /auth/login; API_PREFIX=/api => /api/auth/login
+    app.include_router(api_router)
+    app.include_router(auth_router, prefix=settings.normalized_api_prefix)
+    
+    return app
 
-# 5) Include routers ONLY after CORS and middleware. Paths match frontend:
-#    API_PREFIX empty => /auth/login; API_PREFIX=/api => /api/auth/login
-from app.api.routes import router as api_router
-from app.api.auth_routes import router as auth_router
 
-app.include_router(api_router)
-app.include_router(auth_router, prefix=settings.normalized_api_prefix)
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 """
-Pydantic schemas and DTOs.
+Pydantic schemas and DTOs (plus msgspec structs for internal analysis types).
 
 Request/response models for API, internal data shapes for
 transcription, summarization, and document generation.
@@ -7,7 +7,8 @@ transcription, summarization, and document generation.
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel
 
 
 class ActionItem(BaseModel):
@@ -51,56 +52,86 @@ class AnalysisResult(BaseModel):
     """True if translated_transcript is condensed due to transcript length."""
 
 
-class DecisionWithConfidence(BaseModel):
+# Internal types for Claude's output (chunk map-reduce and the final
+# analysis JSON). These never reach the API, so they are msgspec Structs:
+# decoded straight from Claude's JSON output without pydantic validation
+# overhead.
+
+
+class DecisionWithConfidence(msgspec.Struct, kw_only=True, frozen=True):
     """A decision with confidence level for context-aware processing."""
-    
+
     decision: str
     """What was decided."""
-    
+
     confidence: str = "medium"
     """Confidence level: high, medium, or low."""
 
 
-class ActionItemWithDetails(BaseModel):
+class ActionItemWithDetails(msgspec.Struct, kw_only=True, frozen=True):
     """An action item with full details for context-aware processing."""
-    
+
     task: str
     """What needs to be done."""
-    
+
     owner: Optional[str] = None
     """Person responsible."""
-    
+
     due: Optional[str] = None
     """Due date if specified."""
 
 
-class ChunkAnalysis(BaseModel):
+class ChunkAnalysis(msgspec.Struct, kw_only=True, frozen=True):
     """
     Analysis result for a single transcript chunk (internal use).
-    
-    Used during two-phase context-aware processing of long transcripts.
-    Contains only INCREMENTAL information not already in global context.
+
+    Used during two-phase processing of long transcripts. Chunks are
+    analyzed in parallel, so each result covers everything found in its
+    chunk; GlobalContext.merge_chunk_output drops what is already known.
     """
 
     chunk_summary: str = ""
     """1-2 sentence summary of this chunk's content."""
 
-    new_participants: list[str] = Field(default_factory=list)
-    """Participants appearing for the FIRST TIME in this chunk."""
+    new_participants: list[str] = msgspec.field(default_factory=list)
+    """Everyone speaking or named as a participant in this chunk."""
 
-    decisions: list[DecisionWithConfidence] = Field(default_factory=list)
-    """New decisions identified in this chunk with confidence."""
+    decisions: list[DecisionWithConfidence] = msgspec.field(default_factory=list)
+    """Decisions identified in this chunk with confidence."""
 
-    action_items: list[ActionItemWithDetails] = Field(default_factory=list)
-    """New action items from this chunk."""
+    action_items: list[ActionItemWithDetails] = msgspec.field(default_factory=list)
+    """Action items from this chunk."""
 
-    topics: list[str] = Field(default_factory=list)
+    topics: list[str] = msgspec.field(default_factory=list)
     """Topics discussed in this chunk."""
-    
-    important_notes: list[str] = Field(default_factory=list)
+
+    important_notes: list[str] = msgspec.field(default_factory=list)
     """Corrections, clarifications, or reversals of earlier info."""
 
 
+class AnalysisActionItem(msgspec.Struct, kw_only=True, frozen=True):
+    """An action item as returned by Claude (task is accepted for description)."""
+
+    description: str = ""
+    """What needs to be done."""
+
+    task: str = ""
+    """Alternative key for description."""
+
+    owner: Optional[str] = None
+    """Person responsible."""
+
+
+class ClaudeAnalysis(msgspec.Struct, kw_only=True, frozen=True):
+    """Meeting analysis JSON as returned by Claude (single pass or synthesis)."""
+
+    summary: str = ""
+    participants: list[str] = msgspec.field(default_factory=list)
+    decisions: list[str] = msgspec.field(default_factory=list)
+    action_items: list[AnalysisActionItem] = msgspec.field(default_factory=list)
+    translated_transcript: str = ""
+
+
 class APIResponse(BaseModel):
     """Full API response: transcript plus analysis."""
 
@@ -109,3 +140,22 @@ class APIResponse(BaseModel):
 
     analysis: AnalysisResult
     """Structured analysis including both transcripts."""
+
+
+class JobResponse(BaseModel):
+    """Status of a background processing job."""
+
+    job_id: str
+    """Opaque job identifier returned on submission."""
+
+    status: str
+    """One of: queued, deferred, in_progress, complete, failed."""
+
+    result: Optional[APIResponse] = None
+    """Transcript + analysis once the job is complete."""
+
+    download: bool = False
+    """True if an exported document is available at /jobs/{job_id}/download."""
+
+    error: Optional[str] = None
+    """Failure reason when status is failed."""
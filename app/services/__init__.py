@@ -6,7 +6,7 @@ document generation, and authentication.
 """
 
 from .transcription_service import transcribe_audio
-from .summarization_service import analyze_transcript
+from .summarization_service import analyze_transcript_async
 from .document_service import generate_word_document
 from .pdf_service import generate_pdf_document
 from .auth_service import (
@@ -19,7 +19,7 @@ from .auth_service import (
 
 __all__ = [
     "transcribe_audio",
-    "analyze_transcript",
+    "analyze_transcript_async",
     "generate_word_document",
     "generate_pdf_document",
     "hash_password",
@@ -0,0 +1,73 @@
+"""
+Analysis cache.
+
+Caches AnalysisResults in Redis under
+analysis:{sha256(version, language, transcript)} for
+ANALYSIS_CACHE_TTL_SECONDS, so a retried or re-uploaded recording with the
+same transcript skips the Claude calls. version identifies the pipeline
+(model and prompts) that produced the analysis, so changing either misses.
+
+Disabled when Redis is not configured, fails, or the TTL is 0.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.config.settings import settings
+from app.db.connection import get_redis
+from app.models.schemas import AnalysisResult
+
+
+logger = logging.getLogger("speechi.cache")
+
+
+def _cache_key(transcript: str, language: str, version: str) -> str:
+    """Redis key for the analysis of transcript in language by pipeline version."""
+    digest = hashlib.sha256(f"{version}\0{language}\0{transcript}".encode()).hexdigest()
+    return f"analysis:{digest}"
+
+
+async def get_analysis(transcript: str, language: str, version: str) -> Optional[AnalysisResult]:
+    """Cached analysis of this exact transcript, language and version, or None."""
+    redis = get_redis()
+    if redis is None or settings.analysis_cache_ttl_seconds <= 0:
+        return None
+
+    try:
+        cached = await redis.get(_cache_key(transcript, language, version))
+    except RedisError as e:
+        logger.warning("[CACHE] Redis GET failed: %s", e)
+        return None
+    if cached is None:
+        return None
+
+    try:
+        return AnalysisResult.model_validate_json(cached)
+    except ValidationError as e:
+        logger.warning("[CACHE] Dropping unreadable cached analysis: %s", e)
+        return None
+
+
+async def set_analysis(
+    transcript: str,
+    language: str,
+    version: str,
+    result: AnalysisResult,
+) -> None:
+    """Cache an analysis for ANALYSIS_CACHE_TTL_SECONDS."""
+    redis = get_redis()
+    if redis is None or settings.analysis_cache_ttl_seconds <= 0:
+        return
+
+    try:
+        await redis.setex(
+            _cache_key(transcript, language, version),
+            settings.analysis_cache_ttl_seconds,
+            result.model_dump_json(),
+        )
+    except RedisError as e:
+        logger.warning("[CACHE] Redis SETEX failed: %s", e)
@@ -4,29 +4,73 @@ Authentication service.
 Handles password hashing, JWT token creation/verification,
 and user authentication middleware.
 
-Uses the bcrypt library directly (not passlib) for compatibility
-with bcrypt 4.1+. Bcrypt has a 72-byte limit; we truncate to 72 bytes
-when hashing/verifying.
+New passwords are hashed with Argon2id (argon2-cffi). Legacy bcrypt
+hashes are still accepted on login and upgraded to Argon2id lazily
+(see needs_rehash). Bcrypt has a 72-byte limit; we truncate to 72 bytes
+when verifying legacy hashes.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from fastapi.security.utils import get_authorization_scheme_param
+import jwt
+from jwt.exceptions import InvalidTokenError
 
 from app.config.settings import settings
 from app.db.models import User, UserPublic
+from app.utils.cache_utils import TTLCache
 
 
 # Bcrypt limit in bytes (bcrypt truncates beyond this)
 BCRYPT_MAX_PASSWORD_BYTES = 72
+# Shape of a stored bcrypt hash: $2a$/$2b$/$2y$ + cost + salt/digest, 60 bytes
+_BCRYPT_PREFIXES = (b"$2a$", b"$2b$", b"$2y$")
+_BCRYPT_HASH_LEN = 60
+
+# Argon2id hasher (defaults follow RFC 9106: t=3, m=64 MiB; tunable per deployment)
+_password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost_kib,
+    parallelism=max(1, (os.cpu_count() or 2) // 2),
+    hash_len=32,
+)
+_ARGON2_PREFIX = "$argon2"
+
+# Verified against on unknown emails so login latency doesn't reveal which emails exist
+_DUMMY_HASH = _password_hasher.hash(secrets.token_hex(16))
+
+# Password hashing runs here, off the event loop. argon2/bcrypt release
+# the GIL, so one thread per core hashes in parallel.
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="pwhash",
+)
 
 # Bearer token security
 security = HTTPBearer(auto_error=False)
 
+# JWT signing key, encoded once
+_JWT_KEY = settings.jwt_secret_key.encode("utf-8")
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+# Tokens carry no audience; every token we issue has sub and exp
+_JWT_DECODE_OPTIONS = {"verify_aud": False, "require": ["exp", "sub"]}
+
+# Verified payloads keyed by token digest (raw tokens are never stored)
+_JWT_CACHE = TTLCache(max_entries=settings.jwt_cache_max_entries)
+
 
 # ============================================
 # Password Operations
@@ -41,22 +85,78 @@ def _password_bytes(password: str) -> bytes:
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt. Passwords longer than 72 bytes are truncated."""
-    pw_bytes = _password_bytes(password)
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(pw_bytes, salt)
-    return hashed.decode("utf-8")
+    """Hash a password using Argon2id. Returns the encoded $argon2id$... string."""
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
+    """Verify a password against its hash (Argon2id, or legacy bcrypt)."""
+    if hashed_password.startswith(_ARGON2_PREFIX):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    
+    # Legacy bcrypt hash; reject anything that can't be one before calling into bcrypt
+    hashed_bytes = hashed_password.encode("utf-8")
+    if len(hashed_bytes) != _BCRYPT_HASH_LEN or hashed_bytes[:4] not in _BCRYPT_PREFIXES:
+        return False
+    
     pw_bytes = _password_bytes(plain_password)
     try:
-        return bcrypt.checkpw(pw_bytes, hashed_password.encode("utf-8"))
+        return bcrypt.checkpw(pw_bytes, hashed_bytes)
     except Exception:
         return False
 
 
+def dummy_verify(plain_password: str) -> bool:
+    """
+    Run a full verify against a throwaway hash. Always returns False.
+    
+    Call when the user doesn't exist, so the response takes as long as
+    a real failed login (no user-enumeration timing oracle).
+    """
+    verify_password(plain_password, _DUMMY_HASH)
+    return False
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check if a stored hash should be upgraded.
+    
+    True for legacy bcrypt hashes and for Argon2 hashes created with
+    parameters other than the configured ARGON2_* settings, so changing
+    them upgrades stored hashes on each user's next login. Call after a
+    successful verify_password.
+    """
+    if not hashed_password.startswith(_ARGON2_PREFIX):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+async def ahash_password(password: str) -> str:
+    """hash_password on the hashing pool. Use from async code."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the hashing pool. Use from async code."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+async def adummy_verify(plain_password: str) -> bool:
+    """dummy_verify on the hashing pool. Use from async code."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, dummy_verify, plain_password)
+
+
 # ============================================
 # JWT Operations
 # ============================================
@@ -65,6 +165,9 @@ def create_access_token(user_id: str, email: str) -> str:
     """
     Create a JWT access token.
     
+    The expiry is quantized to the minute, so repeated calls for the same
+    user within a minute return the same (cached) signed token.
+    
     Args:
         user_id: The user's database ID
         email: The user's email
@@ -72,19 +175,25 @@ def create_access_token(user_id: str, email: str) -> str:
     Returns:
         Encoded JWT token
     """
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.jwt_expire_days)
-    
+    exp_minute = (int(time.time()) + settings.jwt_expire_days * 86400) // 60
+    return _encode_token(user_id, email, exp_minute)
+
+
+@lru_cache(maxsize=8192)
+def _encode_token(user_id: str, email: str, exp_minute: int) -> str:
+    """Sign a token expiring at exp_minute (minutes since epoch)."""
+    exp = exp_minute * 60
     payload = {
         "sub": user_id,
         "email": email,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": exp,
+        "iat": exp - settings.jwt_expire_days * 86400,
     }
     
     return jwt.encode(
         payload,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+        _JWT_KEY,
+        algorithm=_JWT_ALGORITHM,
     )
 
 
@@ -92,42 +201,71 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and validate a JWT token.
     
+    Verified payloads are cached for up to jwt_cache_ttl_seconds (never
+    past the token's own exp), so repeat requests with the same token
+    skip signature verification. Invalid tokens are never cached.
+    
     Args:
         token: The JWT token string
     
     Returns:
         Token payload dict or None if invalid
     """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    payload = _JWT_CACHE.get(key)
+    if payload is not None:
+        return payload
+    
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_DECODE_OPTIONS,
         )
-        return payload
-    except JWTError:
+    except InvalidTokenError:
         return None
+    
+    expires_at = time.time() + settings.jwt_cache_ttl_seconds
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    _JWT_CACHE.set(key, payload, expires_at)
+    return payload
 
 
 # ============================================
 # Dependency: Get Current User
 # ============================================
 
-async def get_current_user(
+async def get_token_payload(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-) -> Optional[UserPublic]:
+) -> Optional[dict]:
     """
-    Dependency to get the current authenticated user.
+    Dependency to decode the Bearer token.
     
-    Returns None if no valid token is provided.
-    For endpoints that require auth, check if return is None.
+    Returns None if no valid token is provided. FastAPI caches dependencies
+    per request, so endpoints can depend on this alongside get_current_user
+    without decoding twice.
     """
     if credentials is None:
         return None
+    return decode_access_token(credentials.credentials)
+
+
+async def get_current_user(
+    payload: Optional[dict] = Depends(get_token_payload),
+) -> Optional[UserPublic]:
+    """
+    Dependency to get the current authenticated user.
     
-    token = credentials.credentials
-    payload = decode_access_token(token)
+    Returns None if no valid token is provided.
+    For endpoints that require auth, check if return is None.
     
+    Resolved at most once per request: FastAPI caches dependency results
+    per request, so require_auth and any other dependant share this
+    single User.find_by_id lookup.
+    """
     if payload is None:
         return None
     
@@ -140,6 +278,14 @@ async def get_current_user(
     return user
 
 
+def should_refresh_token(payload: dict) -> bool:
+    """True if the token expires within jwt_refresh_threshold_seconds."""
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return True
+    return exp - time.time() < settings.jwt_refresh_threshold_seconds
+
+
 async def require_auth(
     user: Optional[UserPublic] = Depends(get_current_user),
 ) -> UserPublic:
@@ -165,9 +311,11 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     """
     Extract Bearer token from request headers.
     
-    Used for manual token extraction when needed.
+    Used for manual token extraction outside dependencies; endpoints should
+    depend on `security` instead. Parses the header the same way HTTPBearer
+    does (scheme is case-insensitive).
     """
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        return auth_header[7:]
-    return None
+    scheme, token = get_authorization_scheme_param(request.headers.get("authorization"))
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
@@ -11,12 +11,12 @@ Features:
 - Clean, professional typography
 """
 
-import os
-import tempfile
+import io
 from datetime import datetime
+from functools import lru_cache
 
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor
+from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
@@ -38,15 +38,76 @@ def _format_action_item(item: ActionItem, labels: DocumentLabels) -> str:
 # Word Document Generation
 # ============================================
 
-def _set_rtl_paragraph(paragraph) -> None:
-    """Set RTL direction for a Word paragraph."""
-    pPr = paragraph._p.get_or_add_pPr()
-    bidi = OxmlElement('w:bidi')
-    bidi.set(qn('w:val'), '1')
-    pPr.append(bidi)
+# Styles used by generate_word_document; RTL is set on these once per document
+_RTL_STYLES = ("Normal", "Title", "Heading 1", "List Bullet")
+
+# w:pPr children that must follow w:bidi (OOXML schema order)
+_BIDI_SUCCESSORS = (
+    "w:adjustRightInd", "w:snapToGrid", "w:spacing", "w:ind",
+    "w:contextualSpacing", "w:mirrorIndents", "w:suppressOverlap", "w:jc",
+    "w:textDirection", "w:textAlignment", "w:textboxTightWrap",
+    "w:outlineLvl", "w:divId", "w:cnfStyle", "w:rPr", "w:sectPr", "w:pPrChange",
+)
+
+
+def _apply_rtl_styles(doc) -> None:
+    """Right-align and mark RTL the styles in _RTL_STYLES (inherited by every paragraph)."""
+    for name in _RTL_STYLES:
+        style = doc.styles[name]
+        bidi = OxmlElement('w:bidi')
+        bidi.set(qn('w:val'), '1')
+        style.element.get_or_add_pPr().insert_element_before(bidi, *_BIDI_SUCCESSORS)
+        style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
 
 
-def generate_word_document(analysis: AnalysisResult, language: str = "en") -> str:
+@lru_cache(maxsize=2)
+def _base_document_bytes(rtl: bool) -> bytes:
+    """
+    Empty document (default template, RTL styles applied if rtl), saved once.
+
+    Loading these bytes is cheaper than Document() re-reading and parsing
+    python-docx's bundled template on every export.
+    """
+    doc = Document()
+    if rtl:
+        _apply_rtl_styles(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _add_text(doc, text: str, labels: DocumentLabels) -> None:
+    """Add a body paragraph, or '(None)' if text is empty."""
+    text = (text or "").strip()
+    doc.add_paragraph(text if text else f"({labels['none']})")
+
+
+def _add_transcript(doc, text: str, labels: DocumentLabels) -> None:
+    """
+    Add a transcript as one paragraph per blank-line-separated block.
+
+    Keeps paragraphs small so Word doesn't reflow a single multi-KB
+    paragraph. '(None)' if text is empty.
+    """
+    blocks = [block.strip() for block in (text or "").split("\n\n")]
+    blocks = [block for block in blocks if block]
+    if not blocks:
+        doc.add_paragraph(f"({labels['none']})")
+        return
+    for block in blocks:
+        doc.add_paragraph(block)
+
+
+def _add_bullets(doc, items: list[str], labels: DocumentLabels) -> None:
+    """Add one bullet per item, or a 'None' paragraph if there are none."""
+    if not items:
+        doc.add_paragraph(labels["none"])
+        return
+    for item in items:
+        doc.add_paragraph(item, style="List Bullet")
+
+
+def render_word_document(analysis: AnalysisResult, language: str = "en") -> bytes:
     """
     Build a Word document from analysis with language-aware headings.
 
@@ -60,121 +121,45 @@ def generate_word_document(analysis: AnalysisResult, language: str = "en") -> st
         language: Output language code (en, he, fr, es, ar). Default en.
 
     Returns:
-        Absolute path to the generated .docx file. Caller is responsible for cleanup.
-
-    Raises:
-        OSError: If the temp file cannot be created or written.
+        The .docx file content, built in memory.
     """
     labels = get_labels(language)
-    rtl = is_rtl(language)
-    doc = Document()
-
-    # Set document language for RTL if needed
-    if rtl:
-        # Set default paragraph direction
-        style = doc.styles['Normal']
-        style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    # RTL languages: direction and alignment come from the base document's styles
+    doc = Document(io.BytesIO(_base_document_bytes(is_rtl(language))))
 
     # Title
-    title = doc.add_heading(labels["title"], level=0)
-    if rtl:
-        title.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(title)
+    doc.add_heading(labels["title"], level=0)
 
     # Summary section
-    heading = doc.add_heading(labels["summary"], level=1)
-    if rtl:
-        heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(heading)
-    
-    summary_text = (analysis.summary or "").strip()
-    para = doc.add_paragraph(summary_text if summary_text else f"({labels['none']})")
-    if rtl:
-        para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(para)
+    doc.add_heading(labels["summary"], level=1)
+    _add_text(doc, analysis.summary, labels)
 
     # Clean Transcript section (translated/condensed)
     transcript_label = labels["clean_transcript"]
     if getattr(analysis, "is_condensed", False):
         transcript_label += f" {labels['condensed_note']}"
-    
-    heading = doc.add_heading(transcript_label, level=1)
-    if rtl:
-        heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(heading)
-    
-    transcript_text = (analysis.translated_transcript or "").strip()
-    para = doc.add_paragraph(transcript_text if transcript_text else f"({labels['none']})")
-    if rtl:
-        para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(para)
+    doc.add_heading(transcript_label, level=1)
+    _add_transcript(doc, analysis.translated_transcript, labels)
 
     # Participants section
-    heading = doc.add_heading(labels["participants"], level=1)
-    if rtl:
-        heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(heading)
-    
-    if not analysis.participants:
-        para = doc.add_paragraph(labels["none"])
-        if rtl:
-            para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            _set_rtl_paragraph(para)
-    else:
-        for p in analysis.participants:
-            para = doc.add_paragraph(p, style="List Bullet")
-            if rtl:
-                para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                _set_rtl_paragraph(para)
+    doc.add_heading(labels["participants"], level=1)
+    _add_bullets(doc, analysis.participants, labels)
 
     # Decisions section
-    heading = doc.add_heading(labels["decisions"], level=1)
-    if rtl:
-        heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(heading)
-    
-    if not analysis.decisions:
-        para = doc.add_paragraph(labels["none"])
-        if rtl:
-            para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            _set_rtl_paragraph(para)
-    else:
-        for d in analysis.decisions:
-            para = doc.add_paragraph(d, style="List Bullet")
-            if rtl:
-                para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                _set_rtl_paragraph(para)
+    doc.add_heading(labels["decisions"], level=1)
+    _add_bullets(doc, analysis.decisions, labels)
 
     # Action Items section
-    heading = doc.add_heading(labels["actions"], level=1)
-    if rtl:
-        heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        _set_rtl_paragraph(heading)
-    
-    if not analysis.action_items:
-        para = doc.add_paragraph(labels["none"])
-        if rtl:
-            para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            _set_rtl_paragraph(para)
-    else:
-        for item in analysis.action_items:
-            para = doc.add_paragraph(_format_action_item(item, labels), style="List Bullet")
-            if rtl:
-                para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                _set_rtl_paragraph(para)
+    doc.add_heading(labels["actions"], level=1)
+    _add_bullets(
+        doc, [_format_action_item(item, labels) for item in analysis.action_items], labels
+    )
 
     # Original Transcript section (raw Whisper output) - at the end
-    raw_transcript = getattr(analysis, "raw_transcript", "") or ""
-    if raw_transcript.strip():
-        heading = doc.add_heading(labels["original_transcript"], level=1)
-        if rtl:
-            heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            _set_rtl_paragraph(heading)
-        
-        para = doc.add_paragraph(raw_transcript.strip())
-        if rtl:
-            para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            _set_rtl_paragraph(para)
+    raw_transcript = (getattr(analysis, "raw_transcript", "") or "").strip()
+    if raw_transcript:
+        doc.add_heading(labels["original_transcript"], level=1)
+        _add_transcript(doc, raw_transcript, labels)
 
     # Footer
     doc.add_paragraph()  # Spacer
@@ -184,15 +169,22 @@ def generate_word_document(analysis: AnalysisResult, language: str = "en") -> st
         run.font.size = Pt(9)
         run.font.color.rgb = RGBColor(128, 128, 128)
 
-    # Save to temp file
-    fd, path = tempfile.mkstemp(suffix=".docx")
-    try:
-        os.close(fd)
-        doc.save(path)
-    except Exception:
-        file_utils.delete_temp_file(path)
-        raise
-    return path
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def generate_word_document(analysis: AnalysisResult, language: str = "en") -> str:
+    """
+    Build a Word document (see render_word_document) and write it to a temp file.
+
+    Returns:
+        Absolute path to the generated .docx file. Caller is responsible for cleanup.
+
+    Raises:
+        OSError: If the temp file cannot be created or written.
+    """
+    return file_utils.write_temp_file(render_word_document(analysis, language), ".docx")
 
 
 # ============================================
@@ -0,0 +1,143 @@
+"""
+Job queue.
+
+Enqueues meeting processing on the arq worker (app.workers.meeting_worker)
+and reads job status/results back from Redis. Requires REDIS_URL.
+
+API and worker exchange audio and exported documents through a shared
+directory (JOB_STORAGE_DIR); only paths travel through Redis.
+"""
+
+import logging
+import tempfile
+import uuid
+from functools import cache
+from pathlib import Path
+from typing import Any, Optional
+
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from arq.jobs import Job, JobResult, JobStatus
+
+from app.config.settings import settings
+
+
+logger = logging.getLogger("speechi.jobs")
+
+# Name of the worker function (see app.workers.meeting_worker)
+PROCESS_MEETING_JOB = "process_meeting_job"
+
+# A job not started within this long is dropped from the queue by arq
+JOB_QUEUE_EXPIRY_SECONDS = 86400
+
+_pool: Optional[ArqRedis] = None
+
+
+def is_enabled() -> bool:
+    """Background jobs need Redis."""
+    return bool(settings.redis_url)
+
+
+def redis_settings() -> RedisSettings:
+    """arq connection settings from REDIS_URL."""
+    return RedisSettings.from_dsn(settings.redis_url or "redis://localhost:6379")
+
+
+@cache
+def job_storage_dir() -> str:
+    """Directory shared by API and worker for uploaded audio and exports."""
+    path = Path(settings.job_storage_dir or Path(tempfile.gettempdir()) / "speechi-jobs")
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+async def get_pool() -> ArqRedis:
+    """Get (or lazily create) the arq Redis pool."""
+    global _pool
+
+    if _pool is None:
+        _pool = await create_pool(redis_settings())
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the arq pool. Call on application shutdown."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.aclose()
+        logger.info("[JOBS] Queue connection closed")
+    _pool = None
+
+
+async def enqueue_meeting_job(
+    audio_path: str,
+    language: str,
+    export: Optional[str],
+    user_id: Optional[str],
+    usage_date: Optional[str] = None,
+) -> str:
+    """
+    Queue a meeting for processing.
+
+    Args:
+        audio_path: Uploaded audio inside job_storage_dir (worker deletes it)
+        language: Output language code
+        export: None, "docx" or "pdf"
+        user_id: Authenticated user to charge usage to (None for guests)
+        usage_date: Day the use was charged (from reserve_usage), so a
+            failed job refunds that day even after UTC midnight
+
+    Returns:
+        The job ID.
+    """
+    # user_id goes as a keyword so get_job_info can read the owner back
+    # from the stored job definition
+    job_id = uuid.uuid4().hex
+    pool = await get_pool()
+    await pool.enqueue_job(
+        PROCESS_MEETING_JOB,
+        audio_path,
+        language,
+        export,
+        user_id=user_id,
+        usage_date=usage_date,
+        _job_id=job_id,
+        _expires=JOB_QUEUE_EXPIRY_SECONDS,
+    )
+    return job_id
+
+
+async def get_job_info(job_id: str) -> Optional[dict[str, Any]]:
+    """
+    Look up a job.
+
+    Returns:
+        None if the job is unknown (or its result expired), else a dict with
+        status ("queued", "deferred", "in_progress", "complete", "failed"),
+        result (worker return value when complete), error (when failed) and
+        user_id (who submitted it; None for guests).
+    """
+    job = Job(job_id, await get_pool())
+    status = await job.status()
+    if status == JobStatus.not_found:
+        return None
+
+    # Job definition, or its result once complete (both carry the arguments)
+    job_def = await job.info()
+    if job_def is None:
+        return None
+
+    info: dict[str, Any] = {
+        "status": status.value,
+        "result": None,
+        "error": None,
+        "user_id": job_def.kwargs.get("user_id"),
+    }
+    if status == JobStatus.complete:
+        if isinstance(job_def, JobResult) and job_def.success:
+            info["result"] = job_def.result
+        else:
+            info["status"] = "failed"
+            info["error"] = str(job_def.result) if isinstance(job_def, JobResult) else "Job failed"
+    return info
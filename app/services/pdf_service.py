@@ -10,148 +10,120 @@ Architectural choice: WeasyPrint (HTML → PDF) instead of canvas-based generati
 """
 
 import html
-import os
-import tempfile
+import logging
+import re
+import threading
 from datetime import datetime
+from functools import cache, lru_cache, partial
 from pathlib import Path
 
-from app.models.schemas import ActionItem, AnalysisResult
+from app.models.schemas import AnalysisResult
 from app.utils import file_utils
-from app.utils.document_labels import get_labels, is_rtl, DocumentLabels
+from app.utils.document_labels import get_labels, is_rtl
 
 
+logger = logging.getLogger("speechi.pdf")
+
 # Assets directory for fonts (local files, not CDN)
 _BASE_DIR = Path(__file__).resolve().parent.parent
 _FONTS_DIR = _BASE_DIR / "assets" / "fonts"
 
-# Font files to try (family, filename). Place these in app/assets/fonts/ for full support.
+# Unicode ranges of the script-specific fonts (also used to detect the script)
+_HEBREW_RANGE = "U+0590-05FF, U+FB1D-FB4F"
+_ARABIC_RANGE = "U+0600-06FF, U+0750-077F, U+08A0-08FF, U+FB50-FDFF, U+FE70-FEFF"
+
+# Font files to try (family, filename, unicode-range), best first; the first
+# one found per family is used. Place these in app/assets/fonts/ for full
+# support. The script subsets (see assets/fonts/README.md) are much smaller
+# to load and embed than the full fonts; unicode-range tells WeasyPrint which
+# characters a subset covers.
 _FONT_FILES = [
-    ("Heebo", "Heebo-Regular.woff2"),           # Hebrew
-    ("Heebo", "Heebo-Regular.woff"),
-    ("Noto Sans Arabic", "NotoSansArabic-Regular.woff2"),
-    ("Noto Sans Arabic", "NotoSansArabic-Regular.woff"),
-    ("Noto Sans", "NotoSans-Regular.woff2"),   # Latin fallback
-    ("Noto Sans", "NotoSans-Regular.woff"),
+    ("Heebo", "heebo-hebrew.woff2", _HEBREW_RANGE),           # Hebrew
+    ("Heebo", "Heebo-Regular.woff2", None),
+    ("Heebo", "Heebo-Regular.woff", None),
+    ("Noto Sans Arabic", "noto-arabic.woff2", _ARABIC_RANGE),  # Arabic
+    ("Noto Sans Arabic", "NotoSansArabic-Regular.woff2", None),
+    ("Noto Sans Arabic", "NotoSansArabic-Regular.woff", None),
+    ("Noto Sans", "noto-latin.woff2", None),                  # Latin fallback
+    ("Noto Sans", "NotoSans-Regular.woff2", None),
+    ("Noto Sans", "NotoSans-Regular.woff", None),
 ]
 
 
-def _font_css() -> str:
-    """Build @font-face rules for fonts that exist under assets/fonts. Embedded in PDF."""
+def _range_pattern(unicode_range: str) -> re.Pattern:
+    """Character-class regex matching a CSS unicode-range value."""
+    spans = []
+    for part in unicode_range.split(","):
+        start, _, end = part.strip()[2:].partition("-")
+        spans.append(f"\\u{int(start, 16):04X}-\\u{int(end or start, 16):04X}")
+    return re.compile(f"[{''.join(spans)}]")
+
+
+# Script-specific families, loaded only when the document contains that script
+_SCRIPT_FONTS = [
+    ("Heebo", _range_pattern(_HEBREW_RANGE)),
+    ("Noto Sans Arabic", _range_pattern(_ARABIC_RANGE)),
+]
+_FALLBACK_FONT = "Noto Sans"
+
+
+def _families_for(text: str) -> tuple[str, ...]:
+    """Font families needed to render text: script fonts it uses + the Latin fallback."""
+    families = tuple(family for family, pattern in _SCRIPT_FONTS if pattern.search(text))
+    return families + (_FALLBACK_FONT,)
+
+
+@lru_cache(maxsize=8)
+def _font_css(families: tuple[str, ...]) -> str:
+    """
+    Build @font-face rules for the given families' fonts that exist under
+    assets/fonts. Embedded in PDF; fonts the document doesn't use are left
+    out so WeasyPrint neither loads nor embeds them, and only one file is
+    loaded per family.
+    """
     if not _FONTS_DIR.is_dir():
         return ""
     rules = []
-    for family, filename in _FONT_FILES:
+    found = set()
+    for family, filename, unicode_range in _FONT_FILES:
+        if family not in families or family in found:
+            continue
         path = _FONTS_DIR / filename
         if path.is_file():
+            found.add(family)
             uri = path.as_uri()
+            range_rule = f" unicode-range: {unicode_range};" if unicode_range else ""
             rules.append(
-                f"@font-face {{ font-family: '{family}'; src: url('{uri}'); font-display: swap; }}"
+                f"@font-face {{ font-family: '{family}'; src: url('{uri}');{range_rule} font-display: swap; }}"
             )
     return "\n".join(rules) if rules else ""
 
 
-def _format_action_item(item: ActionItem, labels: DocumentLabels) -> str:
-    """Format a single action item for display."""
-    owner = item.owner.strip() if item.owner else None
-    if owner:
-        return f"{item.description} ({labels['owner']}: {owner})"
-    return f"{item.description} ({labels['owner']}: {labels['unassigned']})"
+# Escape for HTML text content (quotes are safe outside attributes). A partial
+# rather than a wrapper function so each call stays in C.
+_escape = partial(html.escape, quote=False)
 
 
-def _escape(s: str) -> str:
-    """Escape for HTML text content."""
-    return html.escape(s, quote=True)
+def _list_body(items_html: str, none_esc: str) -> str:
+    """Wrap pre-rendered <li> items in a <ul>, or the "none" label if empty."""
+    return f"<ul>{items_html}</ul>" if items_html else f"<p>{none_esc}</p>"
 
 
-def _build_html_document(analysis: AnalysisResult, language: str) -> str:
+@lru_cache(maxsize=16)
+def _page_css(rtl: bool, families: tuple[str, ...]) -> str:
     """
-    Build semantic HTML for the meeting summary.
-    Uses language-aware headings from document_labels. RTL for he/ar.
-    Includes both clean/translated transcript and original transcript.
+    Layout stylesheet for the summary page. Built once per direction and font set.
+
+    Not inlined in the HTML: _stylesheets parses it (with the @font-face
+    rules) once per thread and passes it to WeasyPrint.
     """
-    labels = get_labels(language)
-    rtl = is_rtl(language)
-    dir_attr = "rtl" if rtl else "ltr"
     direction_css = "direction: rtl; text-align: right;" if rtl else "direction: ltr; text-align: left;"
 
-    font_css = _font_css()
-    font_stack = "Heebo, 'Noto Sans Arabic', 'Noto Sans', sans-serif" if font_css else "sans-serif"
-
-    title_esc = _escape(labels["title"])
-    summary_heading = _escape(labels["summary"])
-    
-    # Clean transcript heading with condensed note if applicable
-    clean_transcript_label = labels["clean_transcript"]
-    if getattr(analysis, "is_condensed", False):
-        clean_transcript_label += f" {labels['condensed_note']}"
-    clean_transcript_heading = _escape(clean_transcript_label)
-    
-    original_transcript_heading = _escape(labels["original_transcript"])
-    participants_heading = _escape(labels["participants"])
-    decisions_heading = _escape(labels["decisions"])
-    actions_heading = _escape(labels["actions"])
-    none_esc = _escape(labels["none"])
-    generated_esc = _escape(labels["generated_by"])
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    summary_text = (analysis.summary or "").strip() or none_esc
-    summary_esc = _escape(summary_text)
-
-    # Clean/translated transcript
-    transcript_text = (analysis.translated_transcript or "").strip() or none_esc
-    transcript_esc = _escape(transcript_text).replace("\n", "<br>")
+    font_stack = "sans-serif"
+    if _font_css(families):
+        font_stack = ", ".join(f"'{family}'" for family in families) + ", sans-serif"
 
-    # Original transcript (raw Whisper output)
-    raw_transcript = getattr(analysis, "raw_transcript", "") or ""
-    raw_transcript_text = raw_transcript.strip()
-    raw_transcript_esc = _escape(raw_transcript_text).replace("\n", "<br>") if raw_transcript_text else ""
-
-    # Participants list
-    if analysis.participants:
-        participants_items = "".join(
-            f"<li>{_escape(p)}</li>" for p in analysis.participants
-        )
-        participants_body = f"<ul>{participants_items}</ul>"
-    else:
-        participants_body = f"<p>{none_esc}</p>"
-
-    # Decisions list
-    if analysis.decisions:
-        decisions_items = "".join(
-            f"<li>{_escape(d)}</li>" for d in analysis.decisions
-        )
-        decisions_body = f"<ul>{decisions_items}</ul>"
-    else:
-        decisions_body = f"<p>{none_esc}</p>"
-
-    # Action items list
-    if analysis.action_items:
-        action_items_li = "".join(
-            f"<li>{_escape(_format_action_item(item, labels))}</li>"
-            for item in analysis.action_items
-        )
-        actions_body = f"<ul>{action_items_li}</ul>"
-    else:
-        actions_body = f"<p>{none_esc}</p>"
-
-    # Build original transcript section HTML (only if we have content)
-    original_transcript_section = ""
-    if raw_transcript_esc:
-        original_transcript_section = f"""
-<section>
-<h2>{original_transcript_heading}</h2>
-<p>{raw_transcript_esc}</p>
-</section>"""
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="{language}" dir="{dir_attr}">
-<head>
-<meta charset="UTF-8"/>
-<meta name="viewport" content="width=device-width, initial-scale=1.0"/>
-<title>{title_esc}</title>
-<style>
-{font_css}
-:root {{
+    return f""":root {{
   --font: {font_stack};
   --text: #1a1a1a;
   --muted: #4a4a4a;
@@ -206,7 +178,86 @@ footer {{
   color: var(--muted);
   text-align: center;
 }}
-</style>
+"""
+
+
+def _build_html_document(analysis: AnalysisResult, language: str) -> str:
+    """
+    Build semantic HTML for the meeting summary.
+    Uses language-aware headings from document_labels. RTL for he/ar.
+    Includes both clean/translated transcript and original transcript.
+    Styles are applied separately (see _stylesheets).
+    """
+    labels = get_labels(language)
+    rtl = is_rtl(language)
+    dir_attr = "rtl" if rtl else "ltr"
+
+    esc = _escape
+
+    title_esc = esc(labels["title"])
+    summary_heading = esc(labels["summary"])
+    
+    # Clean transcript heading with condensed note if applicable
+    clean_transcript_label = labels["clean_transcript"]
+    if getattr(analysis, "is_condensed", False):
+        clean_transcript_label += f" {labels['condensed_note']}"
+    clean_transcript_heading = esc(clean_transcript_label)
+    
+    original_transcript_heading = esc(labels["original_transcript"])
+    participants_heading = esc(labels["participants"])
+    decisions_heading = esc(labels["decisions"])
+    actions_heading = esc(labels["actions"])
+    none_esc = esc(labels["none"])
+    generated_esc = esc(labels["generated_by"])
+    date_str = datetime.now().strftime("%Y-%m-%d")
+
+    summary_text = (analysis.summary or "").strip()
+    summary_esc = esc(summary_text) if summary_text else none_esc
+
+    # Clean/translated transcript
+    transcript_text = (analysis.translated_transcript or "").strip()
+    transcript_esc = esc(transcript_text).replace("\n", "<br>") if transcript_text else none_esc
+
+    # Original transcript (raw Whisper output)
+    raw_transcript = getattr(analysis, "raw_transcript", "") or ""
+    raw_transcript_text = raw_transcript.strip()
+    raw_transcript_esc = esc(raw_transcript_text).replace("\n", "<br>") if raw_transcript_text else ""
+
+    participants_body = _list_body(
+        "".join([f"<li>{esc(p)}</li>" for p in analysis.participants]), none_esc
+    )
+    decisions_body = _list_body(
+        "".join([f"<li>{esc(d)}</li>" for d in analysis.decisions]), none_esc
+    )
+
+    # Action items: "description (Owner: name)"; the label parts are escaped once
+    owner_prefix = f" ({esc(labels['owner'])}: "
+    unassigned_suffix = f"{owner_prefix}{esc(labels['unassigned'])})</li>"
+    actions_body = _list_body(
+        "".join([
+            f"<li>{esc(item.description)}{owner_prefix}{esc(owner)})</li>"
+            if (owner := (item.owner or "").strip())
+            else f"<li>{esc(item.description)}{unassigned_suffix}"
+            for item in analysis.action_items
+        ]),
+        none_esc,
+    )
+
+    # Build original transcript section HTML (only if we have content)
+    original_transcript_section = ""
+    if raw_transcript_esc:
+        original_transcript_section = f"""
+<section>
+<h2>{original_transcript_heading}</h2>
+<p>{raw_transcript_esc}</p>
+</section>"""
+
+    html_content = f"""<!DOCTYPE html>
+<html lang="{language}" dir="{dir_attr}">
+<head>
+<meta charset="UTF-8"/>
+<meta name="viewport" content="width=device-width, initial-scale=1.0"/>
+<title>{title_esc}</title>
 </head>
 <body>
 <main>
@@ -239,16 +290,18 @@ footer {{
     return html_content
 
 
+@cache
 def _ensure_weasyprint():
     """
     Import WeasyPrint and its font config. Lazy so the app can start without
     Pango/GObject installed (e.g. on Windows). Raises RuntimeError with
-    setup instructions if native libs are missing.
+    setup instructions if native libs are missing (failures are not cached,
+    so a later call retries).
     """
     try:
-        from weasyprint import HTML as WeasyHTML
+        from weasyprint import CSS as WeasyCSS, HTML as WeasyHTML
         from weasyprint.text.fonts import FontConfiguration
-        return WeasyHTML, FontConfiguration
+        return WeasyHTML, WeasyCSS, FontConfiguration
     except OSError as e:
         msg = str(e).lower()
         if "libgobject" in msg or "libpango" in msg or "cannot load library" in msg:
@@ -262,7 +315,85 @@ def _ensure_weasyprint():
         raise RuntimeError(f"WeasyPrint failed to load: {e}") from e
 
 
-def generate_pdf_document(analysis: AnalysisResult, language: str = "en") -> str:
+def _warm_up() -> None:
+    try:
+        _ensure_weasyprint()
+    except RuntimeError as e:
+        logger.warning("[PDF] WeasyPrint unavailable, PDF export will fail: %s", e)
+
+
+def warm_up() -> None:
+    """
+    Load WeasyPrint and its native libraries (Pango/GObject) in a background
+    thread, so the first PDF export doesn't pay for it. Call on startup.
+    """
+    threading.Thread(target=_warm_up, name="weasyprint-warmup", daemon=True).start()
+
+
+# Per-thread WeasyPrint state (FontConfiguration is not shared across threads)
+_render_state = threading.local()
+
+
+def _stylesheets(rtl: bool, families: tuple[str, ...], WeasyCSS, FontConfiguration) -> tuple:
+    """
+    FontConfiguration and parsed stylesheets (@font-face + layout) for this thread.
+
+    Parsed once per thread, direction and font set: fonts under assets/fonts
+    are registered on the first render that needs them, and later renders
+    only lay out the HTML.
+    """
+    state = getattr(_render_state, "state", None)
+    if state is None:
+        state = _render_state.state = (FontConfiguration(), {})
+    font_config, cache = state
+
+    key = (rtl, families)
+    stylesheets = cache.get(key)
+    if stylesheets is None:
+        font_css = _font_css(families)
+        stylesheets = [WeasyCSS(string=font_css, font_config=font_config)] if font_css else []
+        stylesheets.append(WeasyCSS(string=_page_css(rtl, families), font_config=font_config))
+        cache[key] = stylesheets
+    return font_config, stylesheets
+
+
+def _render_html(html_str: str, rtl: bool) -> bytes:
+    """Render the summary HTML to PDF bytes."""
+    WeasyHTML, WeasyCSS, FontConfiguration = _ensure_weasyprint()
+
+    font_config, stylesheets = _stylesheets(
+        rtl, _families_for(html_str), WeasyCSS, FontConfiguration
+    )
+    return WeasyHTML(string=html_str).write_pdf(
+        stylesheets=stylesheets,
+        font_config=font_config,
+    )
+
+
+@lru_cache(maxsize=16)
+def _render_empty(html_str: str, rtl: bool) -> bytes:
+    """
+    Render the summary of an analysis with no content.
+
+    Keyed on the HTML, which only varies by language and date for empty
+    analyses, so each is laid out once per day.
+    """
+    return _render_html(html_str, rtl)
+
+
+def _is_empty(analysis: AnalysisResult) -> bool:
+    """True if the analysis has nothing to show (every section renders "none")."""
+    return not (
+        (analysis.summary or "").strip()
+        or (analysis.translated_transcript or "").strip()
+        or (getattr(analysis, "raw_transcript", "") or "").strip()
+        or analysis.participants
+        or analysis.decisions
+        or analysis.action_items
+    )
+
+
+def render_pdf_document(analysis: AnalysisResult, language: str = "en") -> bytes:
     """
     Generate a PDF from meeting analysis using WeasyPrint (HTML → PDF).
 
@@ -276,27 +407,26 @@ def generate_pdf_document(analysis: AnalysisResult, language: str = "en") -> str
         language: Output language code (en, he, fr, es, ar). Default en.
 
     Returns:
-        Absolute path to the generated .pdf file. Caller is responsible for cleanup.
+        The PDF content, rendered in memory.
 
     Raises:
         RuntimeError: If WeasyPrint's native libs (Pango/GObject) are not available.
-        OSError: If the temp file cannot be created or written.
     """
-    WeasyHTML, FontConfiguration = _ensure_weasyprint()
-
     html_str = _build_html_document(analysis, language)
-    fd, path = tempfile.mkstemp(suffix=".pdf")
-    os.close(fd)
+    if _is_empty(analysis):
+        return _render_empty(html_str, is_rtl(language))
+    return _render_html(html_str, is_rtl(language))
 
-    try:
-        font_config = FontConfiguration()
-        html_doc = WeasyHTML(string=html_str)
-        html_doc.write_pdf(
-            path,
-            font_config=font_config,
-        )
-    except Exception:
-        file_utils.delete_temp_file(path)
-        raise
-
-    return path
+
+def generate_pdf_document(analysis: AnalysisResult, language: str = "en") -> str:
+    """
+    Generate a PDF (see render_pdf_document) and write it to a temp file.
+
+    Returns:
+        Absolute path to the generated .pdf file. Caller is responsible for cleanup.
+
+    Raises:
+        RuntimeError: If WeasyPrint's native libs (Pango/GObject) are not available.
+        OSError: If the temp file cannot be created or written.
+    """
+    return file_utils.write_temp_file(render_pdf_document(analysis, language), ".pdf")
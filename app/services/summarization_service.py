@@ -4,10 +4,10 @@ Summarization service.
 Enterprise-grade meeting analysis pipeline for long audio conversations (60-120+ minutes).
 Implements a two-phase context-aware chunking architecture:
 
-PHASE 1: Chunk-Level Context Extraction
-  - Each chunk analyzed with rolling global context
-  - Incremental extraction (no repetition)
-  - Context preservation across chunks
+PHASE 1: Chunk-Level Extraction
+  - Chunks analyzed concurrently (bounded by CLAUDE_MAX_CONCURRENCY)
+  - Overlapping chunk boundaries preserve context
+  - Results merged into a global context in transcript order
 
 PHASE 2: Global Context Synthesis
   - Aggregates all chunk results
@@ -21,134 +21,152 @@ Features:
 - Deterministic, stable output
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
-
-from anthropic import Anthropic
-
-from app.models.schemas import ActionItem, AnalysisResult
+from typing import TYPE_CHECKING, Optional
+
+import msgspec
+import orjson
+
+from app.config.settings import settings
+from app.models.schemas import (
+    ActionItem,
+    ActionItemWithDetails,
+    AnalysisActionItem,
+    AnalysisResult,
+    ChunkAnalysis,
+    ClaudeAnalysis,
+    DecisionWithConfidence,
+)
+from app.services import analysis_cache
 from app.utils.env_utils import get_anthropic_api_key
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
 _PROMPT_PATH = Path(__file__).resolve().parent.parent / "prompts" / "meeting_summary_prompt.txt"
 _CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
 _MAX_TOKENS = 8192
 _MAX_TOKENS_CHUNK = 4096
 _MAX_TOKENS_SYNTHESIS = 8192
+# Single pass echoes the whole transcript back translated, so its output
+# budget (not the input context) bounds how long a transcript it can take
+_MAX_TOKENS_SINGLE_PASS = 16384
 
 # Chunking configuration
 # ~1500-2000 tokens ≈ 6000-8000 characters for ~5-7 minutes of speech
-_LONG_TRANSCRIPT_THRESHOLD = 15000  # Characters - trigger chunking above this
+# Up to ~30 minutes of speech, whose translation fits _MAX_TOKENS_SINGLE_PASS
+_LONG_TRANSCRIPT_THRESHOLD = 30000  # Characters - trigger chunking above this
 _CHUNK_SIZE = 7000  # Target chunk size (~5-7 minutes of speech)
 _CHUNK_OVERLAP = 500  # Overlap for context preservation
 
+# Global context caps (most recent kept) so the synthesis prompt stays bounded
+_MAX_CONTEXT_DECISIONS = 100
+_MAX_CONTEXT_ACTION_ITEMS = 100
+_MAX_CONTEXT_TIMELINE = 50
+
 logger = logging.getLogger(__name__)
 
 
+
 # ============================================
 # Data Classes for Context-Aware Processing
 # ============================================
 
-@dataclass
-class Decision:
-    """A decision extracted from the meeting."""
-    decision: str
-    confidence: str = "medium"  # high, medium, low
+def _dedup_key(text: Optional[str]) -> str:
+    """Comparison form of an extracted item: case, spacing and a final period ignored."""
+    return " ".join((text or "").split()).rstrip(".").casefold()
 
 
-@dataclass
-class ActionItemDetail:
-    """An action item with full details."""
-    task: str
-    owner: Optional[str] = None
-    due: Optional[str] = None
+def _action_item_key(item: ActionItemWithDetails) -> tuple[str, str]:
+    """Dedup key of an action item: (task, owner)."""
+    return _dedup_key(item.task), _dedup_key(item.owner)
 
 
-@dataclass
-class ChunkOutput:
-    """Output from analyzing a single chunk."""
-    chunk_summary: str = ""
-    new_participants: list[str] = field(default_factory=list)
-    decisions: list[Decision] = field(default_factory=list)
-    action_items: list[ActionItemDetail] = field(default_factory=list)
-    topics: list[str] = field(default_factory=list)
-    important_notes: list[str] = field(default_factory=list)
-
-
-@dataclass
+@dataclass(slots=True)
 class GlobalContext:
     """
-    Rolling global context passed between chunks.
-    Accumulates information as chunks are processed.
+    Global context aggregated from chunk results.
+    Accumulates information as chunk outputs are merged, in transcript order.
+    Chunks are analyzed independently and overlap, so every list is
+    deduplicated here (see _dedup_key).
     """
     participants: list[str] = field(default_factory=list)
     topics: list[str] = field(default_factory=list)
-    decisions: list[Decision] = field(default_factory=list)
-    action_items: list[ActionItemDetail] = field(default_factory=list)
+    decisions: list[DecisionWithConfidence] = field(default_factory=list)
+    action_items: list[ActionItemWithDetails] = field(default_factory=list)
     timeline: list[str] = field(default_factory=list)  # Chunk summaries in order
     important_notes: list[str] = field(default_factory=list)
+    # Membership indexes (of _dedup_key values) for deduplicating the lists above
+    _seen_participants: set[str] = field(default_factory=set, repr=False)
+    _seen_topics: set[str] = field(default_factory=set, repr=False)
+    _seen_notes: set[str] = field(default_factory=set, repr=False)
+    _seen_decisions: set[str] = field(default_factory=set, repr=False)
+    _seen_action_items: set[tuple[str, str]] = field(default_factory=set, repr=False)
+    # Entries dropped from the capped lists (oldest first)
+    omitted_decisions: int = 0
+    omitted_action_items: int = 0
+    omitted_timeline: int = 0
     
-    def to_prompt_string(self) -> str:
-        """Convert context to a string for inclusion in prompts."""
-        if not any([self.participants, self.topics, self.decisions, 
-                    self.action_items, self.timeline]):
-            return "No prior context (this is the first chunk)."
-        
-        parts = []
-        
-        if self.participants:
-            parts.append(f"Known participants: {', '.join(self.participants)}")
-        
-        if self.topics:
-            parts.append(f"Topics discussed so far: {', '.join(self.topics[-10:])}")  # Last 10
-        
-        if self.decisions:
-            decisions_str = "; ".join(d.decision for d in self.decisions[-5:])  # Last 5
-            parts.append(f"Decisions made: {decisions_str}")
-        
-        if self.action_items:
-            items_str = "; ".join(f"{a.task} ({a.owner or 'unassigned'})" 
-                                  for a in self.action_items[-5:])
-            parts.append(f"Action items: {items_str}")
-        
-        if self.timeline:
-            parts.append(f"Meeting flow: {' → '.join(self.timeline[-5:])}")
-        
-        if self.important_notes:
-            parts.append(f"Important notes: {'; '.join(self.important_notes[-3:])}")
-        
-        return "\n".join(parts)
-    
-    def merge_chunk_output(self, output: ChunkOutput) -> None:
+    def merge_chunk_output(self, output: ChunkAnalysis) -> None:
         """Merge a chunk's output into the global context."""
-        # Add new participants (deduplicated)
+        # Add new participants (deduplicated, ignoring case and spacing)
         for p in output.new_participants:
-            if p and p not in self.participants:
+            key = _dedup_key(p)
+            if key and key not in self._seen_participants:
+                self._seen_participants.add(key)
                 self.participants.append(p)
         
         # Add new topics (deduplicated, keep recent)
         for t in output.topics:
-            if t and t not in self.topics:
+            key = _dedup_key(t)
+            if key and key not in self._seen_topics:
+                self._seen_topics.add(key)
                 self.topics.append(t)
         if len(self.topics) > 20:
             self.topics = self.topics[-20:]
+            self._seen_topics = {_dedup_key(t) for t in self.topics}
         
-        # Add decisions
-        self.decisions.extend(output.decisions)
+        # Add decisions (deduplicated: overlapping chunks often repeat them)
+        for d in output.decisions:
+            key = _dedup_key(d.decision)
+            if key and key not in self._seen_decisions:
+                self._seen_decisions.add(key)
+                self.decisions.append(d)
+        if len(self.decisions) > _MAX_CONTEXT_DECISIONS:
+            self.omitted_decisions += len(self.decisions) - _MAX_CONTEXT_DECISIONS
+            self.decisions = self.decisions[-_MAX_CONTEXT_DECISIONS:]
+            self._seen_decisions = {_dedup_key(d.decision) for d in self.decisions}
         
-        # Add action items
-        self.action_items.extend(output.action_items)
+        # Add action items (deduplicated by task and owner)
+        for a in output.action_items:
+            key = _action_item_key(a)
+            if key[0] and key not in self._seen_action_items:
+                self._seen_action_items.add(key)
+                self.action_items.append(a)
+        if len(self.action_items) > _MAX_CONTEXT_ACTION_ITEMS:
+            self.omitted_action_items += len(self.action_items) - _MAX_CONTEXT_ACTION_ITEMS
+            self.action_items = self.action_items[-_MAX_CONTEXT_ACTION_ITEMS:]
+            self._seen_action_items = {_action_item_key(a) for a in self.action_items}
         
         # Add chunk summary to timeline
         if output.chunk_summary:
             self.timeline.append(output.chunk_summary)
+        if len(self.timeline) > _MAX_CONTEXT_TIMELINE:
+            self.omitted_timeline += len(self.timeline) - _MAX_CONTEXT_TIMELINE
+            self.timeline = self.timeline[-_MAX_CONTEXT_TIMELINE:]
         
-        # Add important notes
+        # Add important notes (deduplicated)
         for note in output.important_notes:
-            if note and note not in self.important_notes:
+            key = _dedup_key(note)
+            if key and key not in self._seen_notes:
+                self._seen_notes.add(key)
                 self.important_notes.append(note)
 
 
@@ -156,11 +174,28 @@ class GlobalContext:
 # Core API Functions
 # ============================================
 
+@cache
 def _load_prompt() -> str:
-    """Load the meeting-analysis system prompt from disk."""
+    """Load the meeting-analysis system prompt from disk (once per process)."""
     return _PROMPT_PATH.read_text(encoding="utf-8").strip()
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "Anthropic":
+    """
+    Shared Anthropic client per API key.
+
+    Reusing one client keeps its HTTP connection pool warm, so chunk,
+    synthesis and repair calls don't each pay a new TLS handshake. The
+    client is thread-safe.
+    """
+    # Imported on first use: the SDK is slow to import and most processes
+    # (startup, health checks, auth-only traffic) never call Claude
+    from anthropic import Anthropic
+    
+    return Anthropic(api_key=api_key, max_retries=settings.claude_max_retries)
+
+
 def _call_claude(
     system: str,
     user_content: str,
@@ -185,56 +220,189 @@ def _call_claude(
         raise RuntimeError("ANTHROPIC_API_KEY is not set")
     
     try:
-        client = Anthropic(api_key=api_key)
-        response = client.messages.create(
+        client = _get_client(api_key)
+        # Streamed so the connection stays active during long generations;
+        # the text is complete as soon as the last token arrives
+        with client.messages.stream(
+            model=_CLAUDE_MODEL,
+            max_tokens=max_tokens,
+            system=_cached_system(system),
+            messages=[{"role": "user", "content": user_content}],
+        ) as stream:
+            parts = list(stream.text_stream)
+            _log_usage(stream.get_final_message().usage)
+    except Exception as e:
+        raise RuntimeError(f"Claude API failed: {e}") from e
+    
+    return "".join(parts).strip()
+
+
+def _cached_system(system: str) -> list[dict]:
+    """
+    System prompt as a prompt-cached block.
+
+    The system prompts (and the tools, which precede them in the cache
+    prefix) are identical across a transcript's chunk and synthesis calls,
+    so later calls within the cache TTL read them from Anthropic's prompt
+    cache. Per-call content stays in the user message.
+    """
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+
+def _log_usage(usage) -> None:
+    """Log a call's token usage, including prompt-cache reads/writes."""
+    logger.debug(
+        "Claude usage: input=%s cache_read=%s cache_write=%s output=%s",
+        usage.input_tokens,
+        getattr(usage, "cache_read_input_tokens", None),
+        getattr(usage, "cache_creation_input_tokens", None),
+        usage.output_tokens,
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_async_client(api_key: str) -> "AsyncAnthropic":
+    """Shared async Anthropic client per API key (see _get_client)."""
+    from anthropic import AsyncAnthropic
+    
+    return AsyncAnthropic(api_key=api_key, max_retries=settings.claude_max_retries)
+
+
+async def _call_claude_async(
+    system: str,
+    user_content: str,
+    max_tokens: int = _MAX_TOKENS,
+) -> str:
+    """
+    Async variant of _call_claude (same arguments, result and errors).
+    """
+    api_key = get_anthropic_api_key()
+    if not api_key:
+        raise RuntimeError("ANTHROPIC_API_KEY is not set")
+    
+    try:
+        client = _get_async_client(api_key)
+        async with client.messages.stream(
+            model=_CLAUDE_MODEL,
+            max_tokens=max_tokens,
+            system=_cached_system(system),
+            messages=[{"role": "user", "content": user_content}],
+        ) as stream:
+            parts = [text async for text in stream.text_stream]
+            _log_usage((await stream.get_final_message()).usage)
+    except Exception as e:
+        raise RuntimeError(f"Claude API failed: {e}") from e
+    
+    return "".join(parts).strip()
+
+
+async def _call_claude_tool_async(
+    system: str,
+    user_content: str,
+    tool: dict,
+    max_tokens: int = _MAX_TOKENS,
+) -> dict:
+    """
+    Make a Claude API call that must answer by calling tool.
+    
+    The tool's input_schema makes Claude return structured input instead
+    of JSON text, so no parsing or repair round-trip is needed.
+    
+    Returns:
+        The tool input.
+        
+    Raises:
+        RuntimeError: If API call fails, key is missing, or no tool input
+            is returned.
+    """
+    api_key = get_anthropic_api_key()
+    if not api_key:
+        raise RuntimeError("ANTHROPIC_API_KEY is not set")
+    
+    try:
+        client = _get_async_client(api_key)
+        response = await client.messages.create(
             model=_CLAUDE_MODEL,
             max_tokens=max_tokens,
-            system=system,
+            system=_cached_system(system),
             messages=[{"role": "user", "content": user_content}],
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]},
         )
     except Exception as e:
         raise RuntimeError(f"Claude API failed: {e}") from e
     
-    text = ""
+    _log_usage(response.usage)
+    return _tool_input(response, tool["name"])
+
+
+def _tool_input(response, tool_name: str) -> dict:
+    """Input of the named tool call in a Messages API response."""
     for block in response.content:
-        text += getattr(block, "text", "") or ""
-    
-    return text.strip()
+        if getattr(block, "type", None) == "tool_use" and block.name == tool_name:
+            if isinstance(block.input, dict):
+                return block.input
+            break
+    raise RuntimeError(
+        f"Claude did not call {tool_name} (stop reason: {getattr(response, 'stop_reason', None)})"
+    )
 
 
 # ============================================
 # JSON Parsing and Repair
 # ============================================
 
+# Comma directly before a closing brace/bracket (invalid in JSON)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+# A backslash escape outside strings, or a string literal (possibly unterminated)
+_STRING_OR_ESCAPE_RE = re.compile(r'\\.?|"(?:[^"\\]+|\\.?)*(?:"|\Z)', re.DOTALL)
+# Inside a literal: an escape pair (kept as is) or a raw control character
+_LITERAL_FIX_RE = re.compile(r'\\.?|[\n\r\t]', re.DOTALL)
+
+
 def _extract_json(raw: str) -> str:
     """
     Extract JSON from Claude response, handling markdown and extra text.
+    
+    Trims by moving [lo, hi) bounds and slices once at the end.
     """
     s = raw.strip()
+    # Common case: Claude followed the "JSON only" instruction
+    if s.startswith("{") and s.endswith("}"):
+        return s
+    
+    lo, hi = 0, len(s)
     
     # Remove markdown code fences
     for marker in ("```json", "```"):
         if s.startswith(marker):
-            s = s[len(marker):].lstrip("\n\r")
+            lo = len(marker)
+            while lo < hi and s[lo] in "\n\r":
+                lo += 1
             break
     
-    if s.endswith("```"):
-        s = s[:-len("```")].rstrip("\n\r")
+    if s.endswith("```", lo, hi):
+        hi -= len("```")
+        while hi > lo and s[hi - 1] in "\n\r":
+            hi -= 1
     
-    s = s.strip()
+    while lo < hi and s[lo].isspace():
+        lo += 1
+    while hi > lo and s[hi - 1].isspace():
+        hi -= 1
     
     # Find JSON object boundaries
-    if not s.startswith("{"):
-        start = s.find("{")
+    if not s.startswith("{", lo, hi):
+        start = s.find("{", lo, hi)
         if start != -1:
-            s = s[start:]
+            lo = start
     
-    if not s.endswith("}"):
-        end = s.rfind("}")
+    if not s.endswith("}", lo, hi):
+        end = s.rfind("}", lo, hi)
         if end != -1:
-            s = s[:end + 1]
+            hi = end + 1
     
-    return s.strip()
+    return s[lo:hi].strip()
 
 
 def _fix_json_string(s: str) -> str:
@@ -242,42 +410,29 @@ def _fix_json_string(s: str) -> str:
     Fix common JSON issues: trailing commas, unescaped characters.
     """
     # Remove trailing commas
-    s = re.sub(r',(\s*[}\]])', r'\1', s)
+    s = _TRAILING_COMMA_RE.sub(r'\1', s)
     
     # Fix unescaped characters in strings
-    result = []
-    in_string = False
-    escape_next = False
-    
-    for char in s:
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            continue
-            
-        if char == '\\':
-            escape_next = True
-            result.append(char)
-            continue
-            
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            continue
-            
-        if in_string:
-            if char == '\n':
-                result.append('\\n')
-                continue
-            if char == '\r':
-                continue
-            if char == '\t':
-                result.append('\\t')
-                continue
-        
-        result.append(char)
-    
-    return ''.join(result)
+    return _STRING_OR_ESCAPE_RE.sub(_fix_string_literal, s)
+
+
+def _fix_string_literal(match: re.Match) -> str:
+    """Escape raw newlines/tabs (and drop CRs) inside a JSON string literal."""
+    literal = match.group(0)
+    if literal[0] != '"':
+        return literal
+    # Escape pairs only need care when a backslash precedes a control character
+    if "\\\n" not in literal and "\\\r" not in literal and "\\\t" not in literal:
+        return _escape_controls(literal)
+    return _LITERAL_FIX_RE.sub(
+        lambda m: m.group(0) if m.group(0)[0] == "\\" else _escape_controls(m.group(0)),
+        literal,
+    )
+
+
+def _escape_controls(text: str) -> str:
+    """Escape newlines/tabs and drop CRs (C-level str.replace passes)."""
+    return text.replace("\r", "").replace("\n", "\\n").replace("\t", "\\t")
 
 
 def _parse_json_safe(text: str) -> dict | None:
@@ -286,19 +441,26 @@ def _parse_json_safe(text: str) -> dict | None:
     """
     # Attempt 1: Direct parse
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         pass
     
-    # Attempt 2: Extract and clean
+    # Attempt 2: Extract and clean (skipped if that changed nothing)
     cleaned = _extract_json(text)
-    try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
-        pass
+    if cleaned != text:
+        try:
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError:
+            pass
     
     # Attempt 3: Fix common issues
     fixed = _fix_json_string(cleaned)
+    try:
+        return orjson.loads(fixed)
+    except orjson.JSONDecodeError:
+        pass
+    
+    # Attempt 4: stdlib json also accepts NaN/Infinity, which orjson rejects
     try:
         return json.loads(fixed)
     except json.JSONDecodeError:
@@ -337,10 +499,68 @@ Output valid JSON only:"""
         raise ValueError(f"JSON repair failed: {e}") from e
 
 
+# Target schema for _repair_json_via_claude
+_ANALYSIS_SCHEMA = '{"summary":"","participants":[],"decisions":[],"action_items":[],"translated_transcript":""}'
+
+
+# Typed decoder for analysis output (fast path for well-formed JSON)
+_ANALYSIS_DECODER = msgspec.json.Decoder(ClaudeAnalysis)
+
+
+def _parse_or_repair(text: str, schema: str) -> dict:
+    """Parse Claude's JSON output, asking Claude to repair it if parsing fails."""
+    data = _parse_json_safe(text)
+    if data is None:
+        data = _repair_json_via_claude(text, schema)
+    return data
+
+
+def _parse_analysis(text: str) -> tuple[ClaudeAnalysis, bool]:
+    """
+    Decode an analysis response (single pass or synthesis) in one typed pass.
+    
+    Falls back to lenient parsing (and Claude repair) if it isn't well-formed.
+    
+    Returns:
+        (analysis, exact); exact is False when the fallback was needed.
+    """
+    try:
+        return _ANALYSIS_DECODER.decode(_extract_json(text)), True
+    except msgspec.MsgspecError:
+        pass
+    
+    return _analysis_from_dict(_parse_or_repair(text, _ANALYSIS_SCHEMA)), False
+
+
+def _analysis_from_dict(data: dict) -> ClaudeAnalysis:
+    """Build a ClaudeAnalysis from loosely-typed JSON, dropping invalid entries."""
+    action_items = [
+        AnalysisActionItem(
+            description=str(item.get("description") or ""),
+            task=str(item.get("task") or ""),
+            owner=str(item["owner"]) if item.get("owner") else None,
+        )
+        for item in data.get("action_items") or []
+        if isinstance(item, dict)
+    ]
+    
+    return ClaudeAnalysis(
+        summary=str(data.get("summary") or ""),
+        participants=_str_list(data.get("participants")),
+        decisions=_str_list(data.get("decisions")),
+        action_items=action_items,
+        translated_transcript=str(data.get("translated_transcript") or ""),
+    )
+
+
 # ============================================
 # Chunking
 # ============================================
 
+# Sentence terminators split_transcript may break after
+_SENTENCE_ENDS = (". ", "! ", "? ", "。", "！", "？")
+
+
 def split_transcript(transcript: str, max_chars: int = _CHUNK_SIZE) -> list[str]:
     """
     Split transcript into chunks for processing.
@@ -351,39 +571,49 @@ def split_transcript(transcript: str, max_chars: int = _CHUNK_SIZE) -> list[str]
     if len(transcript) <= max_chars:
         return [transcript]
     
+    # Walk the transcript by index; only the emitted chunks are copied
     chunks: list[str] = []
-    remaining = transcript
+    pos = 0
+    end = len(transcript)
+    stripped_end = len(transcript.rstrip())
     
-    while remaining:
-        if len(remaining) <= max_chars:
-            chunks.append(remaining)
+    while pos < end:
+        if end - pos <= max_chars:
+            chunks.append(transcript[pos:end])
             break
         
-        chunk = remaining[:max_chars]
+        window_end = pos + max_chars
+        
+        def rfind(sep: str) -> int:
+            """Offset of the last sep in the current window (-1 if none)."""
+            found = transcript.rfind(sep, pos, window_end)
+            return found - pos if found != -1 else -1
         
         # Find best split point (paragraph > newline > sentence > space)
-        split_pos = chunk.rfind("\n\n")
+        split_pos = rfind("\n\n")
         
         if split_pos < max_chars // 2:
-            split_pos = chunk.rfind("\n")
+            split_pos = rfind("\n")
         
         if split_pos < max_chars // 2:
-            for end_char in [". ", "! ", "? ", "。", "！", "？"]:
-                pos = chunk.rfind(end_char)
-                if pos > split_pos:
-                    split_pos = pos + 1
+            for end_char in _SENTENCE_ENDS:
+                p = rfind(end_char)
+                if p > split_pos:
+                    split_pos = p + 1
         
         if split_pos < max_chars // 2:
-            split_pos = chunk.rfind(" ")
+            split_pos = rfind(" ")
         
         if split_pos < max_chars // 4:
             split_pos = max_chars
         
-        chunks.append(remaining[:split_pos].strip())
+        chunks.append(transcript[pos:pos + split_pos].strip())
         
-        # Start next chunk with overlap
-        overlap_start = max(0, split_pos - _CHUNK_OVERLAP)
-        remaining = remaining[overlap_start:].strip()
+        # Start next chunk with overlap, skipping whitespace at either end
+        pos += max(0, split_pos - _CHUNK_OVERLAP)
+        end = stripped_end
+        while pos < end and transcript[pos].isspace():
+            pos += 1
     
     return chunks
 
@@ -392,21 +622,21 @@ def split_transcript(transcript: str, max_chars: int = _CHUNK_SIZE) -> list[str]
 # PHASE 1: Chunk Analysis with Context
 # ============================================
 
-def _get_chunk_analysis_prompt() -> str:
-    """System prompt for context-aware chunk analysis."""
-    return """You are analyzing a PORTION of a longer meeting transcript.
+# System prompt for chunk analysis (chunks are analyzed in parallel)
+_CHUNK_ANALYSIS_PROMPT = """You are analyzing a PORTION of a longer meeting transcript.
 
-You will receive:
-1. GLOBAL CONTEXT: Information already extracted from previous chunks
-2. CURRENT CHUNK: The transcript segment to analyze
+You will receive one CURRENT CHUNK: a transcript segment. Other chunks are
+analyzed separately at the same time, so you do not see what they contain.
 
-Your task: Extract ONLY NEW information from this chunk that is NOT already in the global context.
+Your task: Extract everything relevant in this chunk. Duplicates across
+chunks (including text repeated in the overlap between neighbouring
+chunks) are merged afterwards.
 
-## Output Schema (JSON only, no markdown):
+## Output: call the emit_chunk_analysis tool with this structure:
 
 {
   "chunk_summary": "1-2 sentence summary of what happens in THIS chunk",
-  "new_participants": ["Names appearing for the FIRST TIME only"],
+  "new_participants": ["Everyone speaking or named as a participant in this chunk"],
   "decisions": [
     {"decision": "What was decided", "confidence": "high|medium|low"}
   ],
@@ -419,96 +649,142 @@ Your task: Extract ONLY NEW information from this chunk that is NOT already in t
 
 ## Critical Rules:
 
-1. **No Repetition**: Do NOT include participants, decisions, or action items already in GLOBAL CONTEXT
+1. **Be Complete**: Include every participant, decision, and action item in this chunk, even if it may also appear in another chunk
 2. **No Hallucination**: Only extract what is EXPLICITLY stated
 3. **Confidence Levels**:
    - "high": Clearly stated, explicit agreement
    - "medium": Implied or suggested
    - "low": Tentative, needs confirmation
-4. **Empty is OK**: If nothing new, return empty arrays
-5. **Valid JSON**: Output must be parseable JSON, no commentary
-
-Output the JSON object only."""
+4. **Empty is OK**: If the chunk has none of an item, return an empty array
+
+Call emit_chunk_analysis once with your analysis."""
+
+
+# Structured output for chunk analysis (mirrors ChunkAnalysis)
+_CHUNK_TOOL = {
+    "name": "emit_chunk_analysis",
+    "description": "Record the information extracted from the current transcript chunk.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "chunk_summary": {"type": "string"},
+            "new_participants": {"type": "array", "items": {"type": "string"}},
+            "decisions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "decision": {"type": "string"},
+                        "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+                    },
+                    "required": ["decision", "confidence"],
+                },
+            },
+            "action_items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "task": {"type": "string"},
+                        "owner": {"type": ["string", "null"]},
+                        "due": {"type": ["string", "null"]},
+                    },
+                    "required": ["task"],
+                },
+            },
+            "topics": {"type": "array", "items": {"type": "string"}},
+            "important_notes": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": [
+            "chunk_summary",
+            "new_participants",
+            "decisions",
+            "action_items",
+            "topics",
+            "important_notes",
+        ],
+    },
+}
 
 
-def _analyze_chunk_with_context(
+def _chunk_user_content(
     chunk: str,
     chunk_index: int,
     total_chunks: int,
-    global_context: GlobalContext,
     language: str,
-) -> ChunkOutput:
+) -> str:
+    """User message for analyzing one chunk."""
+    return f"""## CURRENT CHUNK ({chunk_index + 1} of {total_chunks}):
+
+{chunk}
+
+## Target output language: {language}
+
+Extract everything relevant in this chunk."""
+
+
+def _chunk_output_from_input(data: dict) -> tuple[ChunkAnalysis, bool]:
     """
-    Analyze a single chunk with awareness of global context.
+    Convert emit_chunk_analysis input; lenient conversion if it doesn't match the schema.
     
-    This is PHASE 1 of the two-phase model.
+    Returns:
+        (chunk analysis, exact); exact is False when invalid entries were dropped.
     """
-    system = _get_chunk_analysis_prompt()
-    
-    context_str = global_context.to_prompt_string()
-    
-    user_content = f"""## GLOBAL CONTEXT (from previous chunks):
-{context_str}
+    try:
+        return msgspec.convert(data, ChunkAnalysis), True
+    except msgspec.ValidationError:
+        return _chunk_analysis_from_dict(data), False
 
-## CURRENT CHUNK ({chunk_index + 1} of {total_chunks}):
 
-{chunk}
+def _incomplete_chunk(chunk_index: int) -> ChunkAnalysis:
+    """Placeholder for a chunk whose analysis failed."""
+    return ChunkAnalysis(chunk_summary=f"[Chunk {chunk_index + 1} analysis incomplete]")
 
-## Target output language: {language}
 
-Extract ONLY new information not already in the global context.
-Output JSON only:"""
+def _str_list(value) -> list[str]:
+    """Keep only non-empty strings from a JSON list."""
+    if not isinstance(value, list):
+        return []
+    return [v for v in value if isinstance(v, str) and v]
 
-    try:
-        text = _call_claude(system, user_content, max_tokens=_MAX_TOKENS_CHUNK)
-        data = _parse_json_safe(text)
-        
-        if data is None:
-            # Try repair
-            schema = '{"chunk_summary":"","new_participants":[],"decisions":[],"action_items":[],"topics":[],"important_notes":[]}'
-            data = _repair_json_via_claude(text, schema)
-        
-        # Parse into ChunkOutput
-        decisions = [
-            Decision(
-                decision=d.get("decision", ""),
-                confidence=d.get("confidence", "medium")
-            )
-            for d in data.get("decisions", [])
-            if isinstance(d, dict) and d.get("decision")
-        ]
-        
-        action_items = [
-            ActionItemDetail(
-                task=a.get("task", ""),
-                owner=a.get("owner"),
-                due=a.get("due")
-            )
-            for a in data.get("action_items", [])
-            if isinstance(a, dict) and a.get("task")
-        ]
-        
-        return ChunkOutput(
-            chunk_summary=data.get("chunk_summary", ""),
-            new_participants=data.get("new_participants", []),
-            decisions=decisions,
-            action_items=action_items,
-            topics=data.get("topics", []),
-            important_notes=data.get("important_notes", []),
+
+def _chunk_analysis_from_dict(data: dict) -> ChunkAnalysis:
+    """Build a ChunkAnalysis from loosely-typed JSON, dropping invalid entries."""
+    decisions = [
+        DecisionWithConfidence(
+            decision=str(d["decision"]),
+            confidence=str(d.get("confidence") or "medium"),
         )
-        
-    except Exception as e:
-        logger.warning("Chunk %d analysis failed: %s", chunk_index, e)
-        return ChunkOutput(chunk_summary=f"[Chunk {chunk_index + 1} analysis incomplete]")
+        for d in data.get("decisions") or []
+        if isinstance(d, dict) and d.get("decision")
+    ]
+    
+    action_items = [
+        ActionItemWithDetails(
+            task=str(a["task"]),
+            owner=str(a["owner"]) if a.get("owner") else None,
+            due=str(a["due"]) if a.get("due") else None,
+        )
+        for a in data.get("action_items") or []
+        if isinstance(a, dict) and a.get("task")
+    ]
+    
+    return ChunkAnalysis(
+        chunk_summary=str(data.get("chunk_summary") or ""),
+        new_participants=_str_list(data.get("new_participants")),
+        decisions=decisions,
+        action_items=action_items,
+        topics=_str_list(data.get("topics")),
+        important_notes=_str_list(data.get("important_notes")),
+    )
 
 
 # ============================================
 # PHASE 2: Final Synthesis
 # ============================================
 
-def _get_synthesis_prompt() -> str:
-    """System prompt for final synthesis."""
-    return """You are synthesizing a complete meeting analysis from chunk-level extractions.
+# System prompt for final synthesis
+_SYNTHESIS_PROMPT = """You are synthesizing a complete meeting analysis from chunk-level extractions.
 
 You will receive:
 1. AGGREGATED CONTEXT: All participants, decisions, action items, and notes
@@ -541,15 +817,8 @@ Your task: Produce a coherent, final meeting analysis.
 Output the JSON object only."""
 
 
-def _synthesize_final_output(
-    global_context: GlobalContext,
-    language: str,
-) -> dict:
-    """
-    PHASE 2: Synthesize all chunk results into final output.
-    """
-    system = _get_synthesis_prompt()
-    
+def _synthesis_user_content(global_context: GlobalContext, language: str) -> str:
+    """User message for PHASE 2: the aggregated context of all chunks."""
     # Build comprehensive context for synthesis
     participants_str = ", ".join(global_context.participants) if global_context.participants else "Unknown"
     
@@ -557,16 +826,22 @@ def _synthesize_final_output(
         f"- {d.decision} (confidence: {d.confidence})"
         for d in global_context.decisions
     ) if global_context.decisions else "None identified"
+    if global_context.omitted_decisions:
+        decisions_str = f"({global_context.omitted_decisions} earlier decisions omitted)\n{decisions_str}"
     
     actions_str = "\n".join(
         f"- {a.task} (owner: {a.owner or 'unassigned'}, due: {a.due or 'not specified'})"
         for a in global_context.action_items
     ) if global_context.action_items else "None identified"
+    if global_context.omitted_action_items:
+        actions_str = f"({global_context.omitted_action_items} earlier action items omitted)\n{actions_str}"
     
     timeline_str = "\n".join(
-        f"{i+1}. {summary}"
-        for i, summary in enumerate(global_context.timeline)
+        f"{i}. {summary}"
+        for i, summary in enumerate(global_context.timeline, global_context.omitted_timeline + 1)
     ) if global_context.timeline else "No timeline available"
+    if global_context.omitted_timeline:
+        timeline_str = f"(chunks 1-{global_context.omitted_timeline} omitted)\n{timeline_str}"
     
     notes_str = "\n".join(f"- {n}" for n in global_context.important_notes) if global_context.important_notes else "None"
     
@@ -591,152 +866,196 @@ def _synthesize_final_output(
 
 Synthesize into final meeting analysis. Output JSON only:"""
 
-    text = _call_claude(system, user_content, max_tokens=_MAX_TOKENS_SYNTHESIS)
-    data = _parse_json_safe(text)
-    
-    if data is None:
-        schema = '{"summary":"","participants":[],"decisions":[],"action_items":[],"translated_transcript":""}'
-        data = _repair_json_via_claude(text, schema)
-    
-    return data
+    return user_content
 
 
 # ============================================
-# Main Analysis Functions
+# Result Building
 # ============================================
 
-def _analyze_short_transcript(transcript: str, output_language: str) -> AnalysisResult:
-    """
-    Analyze a short/medium transcript in a single pass.
-    Used when transcript is below chunking threshold.
-    """
-    system = _load_prompt()
+def _short_user_content(transcript: str, output_language: str) -> str:
+    """User message for single-pass analysis."""
     transcript_block = transcript.strip() if transcript.strip() else "(empty)"
-    user_content = f"Target output language: {output_language}\n\nTranscript:\n\n{transcript_block}"
-    
-    text = _call_claude(system, user_content)
-    
-    if not text:
-        raise ValueError("Claude returned empty analysis")
-    
-    data = _parse_json_safe(text)
-    
-    if data is None:
-        schema = '{"summary":"","participants":[],"decisions":[],"action_items":[],"translated_transcript":""}'
-        data = _repair_json_via_claude(text, schema)
-    
-    action_items = [
-        ActionItem(
-            description=item.get("description", item.get("task", "")),
-            owner=item.get("owner")
-        )
-        for item in data.get("action_items", [])
-        if isinstance(item, dict)
+    return f"Target output language: {output_language}\n\nTranscript:\n\n{transcript_block}"
+
+
+def _action_items(analysis: ClaudeAnalysis) -> list[ActionItem]:
+    """API action items from Claude's (description or task, owner) entries."""
+    return [
+        ActionItem(description=item.description or item.task, owner=item.owner)
+        for item in analysis.action_items
     ]
+
+
+def _short_result(analysis: ClaudeAnalysis, transcript: str, output_language: str) -> AnalysisResult:
+    """Build the AnalysisResult of a single-pass analysis."""
+    return AnalysisResult(
+        summary=analysis.summary,
+        participants=analysis.participants,
+        decisions=analysis.decisions,
+        action_items=_action_items(analysis),
+        translated_transcript=analysis.translated_transcript,
+        raw_transcript=transcript,
+        language=output_language,
+        is_condensed=False,
+    )
+
+
+def _long_result(
+    final: ClaudeAnalysis,
+    global_context: GlobalContext,
+    transcript: str,
+    output_language: str,
+) -> AnalysisResult:
+    """Build the AnalysisResult of a chunked analysis from the synthesis output."""
+    # Ensure we have participants from global context if synthesis missed them
+    participants = final.participants
+    if not participants and global_context.participants:
+        participants = global_context.participants
+    
+    # Ensure we have decisions from global context if synthesis missed them
+    decisions = final.decisions
+    if not decisions and global_context.decisions:
+        decisions = [d.decision for d in global_context.decisions]
     
     return AnalysisResult(
-        summary=data.get("summary", ""),
-        participants=data.get("participants", []),
-        decisions=data.get("decisions", []),
-        action_items=action_items,
-        translated_transcript=data.get("translated_transcript", ""),
+        summary=final.summary,
+        participants=participants,
+        decisions=decisions,
+        action_items=_action_items(final),
+        translated_transcript=final.translated_transcript,
         raw_transcript=transcript,
         language=output_language,
+        is_condensed=True,
+    )
+
+
+def _empty_result(output_language: str) -> AnalysisResult:
+    """Result for an empty transcript (no Claude call)."""
+    return AnalysisResult(
+        summary="No transcript content to analyze.",
+        participants=[],
+        decisions=[],
+        action_items=[],
+        translated_transcript="",
+        raw_transcript="",
+        language=output_language,
         is_condensed=False,
     )
 
 
-def _analyze_long_transcript(transcript: str, output_language: str) -> AnalysisResult:
+# ============================================
+# Main Analysis Functions
+# ============================================
+
+async def _analyze_chunk_async(
+    chunk: str,
+    chunk_index: int,
+    total_chunks: int,
+    language: str,
+    semaphore: asyncio.Semaphore,
+) -> tuple[ChunkAnalysis, bool]:
     """
-    Analyze a long transcript using two-phase context-aware chunking.
+    Analyze a single chunk (PHASE 1). The semaphore bounds requests in flight.
     
-    PHASE 1: Process each chunk with rolling global context
-    PHASE 2: Synthesize all results into final output
+    Chunks run concurrently, so none sees another's results.
+    
+    Returns:
+        (chunk analysis, complete); a failed chunk gives a placeholder and False.
     """
+    user_content = _chunk_user_content(chunk, chunk_index, total_chunks, language)
+    try:
+        async with semaphore:
+            data = await _call_claude_tool_async(
+                _CHUNK_ANALYSIS_PROMPT, user_content, _CHUNK_TOOL, max_tokens=_MAX_TOKENS_CHUNK
+            )
+        return _chunk_output_from_input(data)
+    except Exception as e:
+        logger.warning("Chunk %d analysis failed: %s", chunk_index, e)
+        return _incomplete_chunk(chunk_index), False
+
+
+async def _analyze_long_transcript_async(
+    transcript: str,
+    output_language: str,
+) -> tuple[AnalysisResult, bool]:
+    """
+    Two-phase chunked analysis with PHASE 1 chunks sent to Claude concurrently.
+    
+    Chunks don't see each other's results; outputs are merged in transcript
+    order and PHASE 2 synthesis resolves overlaps between them.
+    
+    Returns:
+        (result, complete); complete is False if any chunk failed or any
+        output needed lenient parsing.
+    """
+    chunks = split_transcript(transcript)
     logger.info(
-        "Long transcript detected (%d chars). Using context-aware chunking.",
-        len(transcript)
+        "Long transcript detected (%d chars). Analyzing %d chunks concurrently.",
+        len(transcript),
+        len(chunks),
     )
     
-    # Split into chunks
-    chunks = split_transcript(transcript)
-    logger.info("Split into %d chunks for processing", len(chunks))
+    semaphore = asyncio.Semaphore(max(1, settings.claude_max_concurrency))
+    outputs = await asyncio.gather(*(
+        _analyze_chunk_async(chunk, i, len(chunks), output_language, semaphore)
+        for i, chunk in enumerate(chunks)
+    ))
     
-    # Initialize global context
     global_context = GlobalContext()
-    
-    # PHASE 1: Process each chunk with context
-    for i, chunk in enumerate(chunks):
-        logger.info("Processing chunk %d/%d with context", i + 1, len(chunks))
-        
-        chunk_output = _analyze_chunk_with_context(
-            chunk=chunk,
-            chunk_index=i,
-            total_chunks=len(chunks),
-            global_context=global_context,
-            language=output_language,
-        )
-        
-        # Merge chunk output into global context
+    complete = True
+    for chunk_output, chunk_complete in outputs:
         global_context.merge_chunk_output(chunk_output)
-        
-        logger.info(
-            "Chunk %d: +%d participants, +%d decisions, +%d actions",
-            i + 1,
-            len(chunk_output.new_participants),
-            len(chunk_output.decisions),
-            len(chunk_output.action_items),
-        )
+        complete = complete and chunk_complete
     
-    # PHASE 2: Final synthesis
     logger.info("Starting final synthesis with %d timeline entries", len(global_context.timeline))
+    text = await _call_claude_async(
+        _SYNTHESIS_PROMPT,
+        _synthesis_user_content(global_context, output_language),
+        max_tokens=_MAX_TOKENS_SYNTHESIS,
+    )
+    # Lenient parsing may call Claude (sync) to repair the JSON
+    final, exact = await asyncio.to_thread(_parse_analysis, text)
     
-    final_data = _synthesize_final_output(global_context, output_language)
-    
-    # Build AnalysisResult
-    action_items = [
-        ActionItem(
-            description=item.get("description", item.get("task", "")),
-            owner=item.get("owner")
-        )
-        for item in final_data.get("action_items", [])
-        if isinstance(item, dict)
-    ]
+    result = _long_result(final, global_context, transcript, output_language)
+    return result, complete and exact
+
+
+async def _analyze_short_transcript_async(
+    transcript: str,
+    output_language: str,
+) -> tuple[AnalysisResult, bool]:
+    """
+    Analyze a short/medium transcript in a single pass.
+    Used when transcript is below chunking threshold.
     
-    # Ensure we have participants from global context if synthesis missed them
-    participants = final_data.get("participants", [])
-    if not participants and global_context.participants:
-        participants = global_context.participants
+    Returns:
+        (result, complete); complete is False if the output needed lenient parsing.
+    """
+    text = await _call_claude_async(
+        _load_prompt(),
+        _short_user_content(transcript, output_language),
+        max_tokens=_MAX_TOKENS_SINGLE_PASS,
+    )
     
-    # Ensure we have decisions from global context if synthesis missed them
-    decisions = final_data.get("decisions", [])
-    if not decisions and global_context.decisions:
-        decisions = [d.decision for d in global_context.decisions]
+    if not text:
+        raise ValueError("Claude returned empty analysis")
     
-    return AnalysisResult(
-        summary=final_data.get("summary", ""),
-        participants=participants,
-        decisions=decisions,
-        action_items=action_items,
-        translated_transcript=final_data.get("translated_transcript", ""),
-        raw_transcript=transcript,
-        language=output_language,
-        is_condensed=True,
-    )
+    analysis, exact = await asyncio.to_thread(_parse_analysis, text)
+    return _short_result(analysis, transcript, output_language), exact
 
 
-def analyze_transcript(transcript: str, output_language: str) -> AnalysisResult:
+async def analyze_transcript_async(transcript: str, output_language: str) -> AnalysisResult:
     """
     Analyze a meeting transcript and return structured summary data.
 
-    For short/medium transcripts: single-pass analysis
-    For long transcripts (60-120+ minutes): two-phase context-aware chunking
+    For short/medium transcripts (up to ~30 minutes): single-pass analysis
+    For long transcripts (60-120+ minutes): two-phase chunking, with chunks
+    sent to Claude concurrently (up to CLAUDE_MAX_CONCURRENCY in flight)
 
-    The two-phase model ensures:
-    - Context preservation across chunks
-    - No information loss
-    - Coherent final output
-    - Stable JSON parsing
+    Results are cached in Redis by exact transcript (see analysis_cache),
+    unless a chunk failed or Claude's output needed lenient parsing: a
+    degraded analysis is returned but not cached, so a retry tries again.
 
     Args:
         transcript: Plain-text transcript (e.g. from Whisper).
@@ -753,25 +1072,27 @@ def analyze_transcript(transcript: str, output_language: str) -> AnalysisResult:
     transcript_length = len(transcript.strip())
     
     if transcript_length == 0:
-        return AnalysisResult(
-            summary="No transcript content to analyze.",
-            participants=[],
-            decisions=[],
-            action_items=[],
-            translated_transcript="",
-            raw_transcript="",
-            language=output_language,
-            is_condensed=False,
-        )
+        return _empty_result(output_language)
+    
+    cached = await analysis_cache.get_analysis(transcript, output_language, _pipeline_version())
+    if cached is not None:
+        logger.info("Analysis cache hit (%d chars)", transcript_length)
+        return cached
     
-    # Choose processing strategy based on length
     if transcript_length > _LONG_TRANSCRIPT_THRESHOLD:
-        result = _analyze_long_transcript(transcript, output_language)
+        result, complete = await _analyze_long_transcript_async(transcript, output_language)
     else:
-        result = _analyze_short_transcript(transcript, output_language)
+        result, complete = await _analyze_short_transcript_async(transcript, output_language)
     
-    # Final validation
-    try:
-        return AnalysisResult.model_validate(result.model_dump())
-    except Exception as e:
-        raise ValueError(f"Analysis result does not match schema: {e}") from e
+    if complete:
+        await analysis_cache.set_analysis(transcript, output_language, _pipeline_version(), result)
+    else:
+        logger.warning("Analysis is incomplete; not caching it (%d chars)", transcript_length)
+    return result
+
+
+@cache
+def _pipeline_version() -> str:
+    """Fingerprint of the model and prompts, so cached analyses from older ones miss."""
+    parts = (_CLAUDE_MODEL, _load_prompt(), _CHUNK_ANALYSIS_PROMPT, _SYNTHESIS_PROMPT)
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
@@ -0,0 +1,55 @@
+"""
+Transcript cache.
+
+Caches Whisper transcripts in Redis under transcript:{sha256(audio)} for
+TRANSCRIPT_CACHE_TTL_SECONDS, so re-uploading the same recording (a retry,
+or the same meeting in another language) skips the Whisper call.
+
+Disabled when Redis is not configured, fails, or the TTL is 0.
+"""
+
+import logging
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.config.settings import settings
+from app.db.connection import get_redis
+
+
+logger = logging.getLogger("speechi.cache")
+
+
+def _cache_key(audio_digest: str) -> str:
+    """Redis key for the transcript of the audio with this sha256 digest."""
+    return f"transcript:{audio_digest}"
+
+
+async def get_transcript(audio_digest: str) -> Optional[str]:
+    """Cached transcript of this exact audio, or None."""
+    redis = get_redis()
+    if redis is None or settings.transcript_cache_ttl_seconds <= 0:
+        return None
+
+    try:
+        cached = await redis.get(_cache_key(audio_digest))
+    except RedisError as e:
+        logger.warning("[CACHE] Redis GET failed: %s", e)
+        return None
+    return cached
+
+
+async def set_transcript(audio_digest: str, transcript: str) -> None:
+    """Cache a transcript for TRANSCRIPT_CACHE_TTL_SECONDS."""
+    redis = get_redis()
+    if redis is None or settings.transcript_cache_ttl_seconds <= 0:
+        return
+
+    try:
+        await redis.setex(
+            _cache_key(audio_digest),
+            settings.transcript_cache_ttl_seconds,
+            transcript,
+        )
+    except RedisError as e:
+        logger.warning("[CACHE] Redis SETEX failed: %s", e)
@@ -5,19 +5,61 @@ Orchestrates audio-to-text via Whisper API.
 Handles file validation, format checks, and error handling for transcription.
 """
 
+import asyncio
+import hashlib
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Union
 
-from openai import OpenAI
-
+from app.services import transcript_cache
+from app.utils import audio_utils
 from app.utils.env_utils import get_openai_api_key
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
 WHISPER_MODEL = "whisper-1"
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "OpenAI":
+    """
+    Shared OpenAI client per API key.
+
+    Reusing one client keeps its HTTP connection pool warm, so uploads
+    don't each pay a new TLS handshake. The client is thread-safe.
+    """
+    # Imported on first use (slow to import; see summarization_service._get_client)
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_async_client(api_key: str) -> "AsyncOpenAI":
+    """Shared async OpenAI client per API key (see _get_client)."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key)
+
+
+def _checked_path(file_path: str) -> Path:
+    """Path of an existing regular file, else ValueError."""
+    path = Path(file_path)
+    if not path.exists():
+        raise ValueError(f"File not found: {file_path}")
+    if not path.is_file():
+        raise ValueError(f"Not a file: {file_path}")
+    return path
+
+
 def transcribe_audio(file_path: str) -> str:
     """
     Transcribe an audio file to plain text using the OpenAI Whisper API.
 
+    Large files are re-encoded to speech-quality MP3 first when ffmpeg is
+    available (see audio_utils.compress_for_whisper).
+
     Args:
         file_path: Path to the audio file (e.g. mp3, wav, m4a).
 
@@ -28,25 +70,87 @@ def transcribe_audio(file_path: str) -> str:
         ValueError: Invalid or unreadable file.
         RuntimeError: Missing OPENAI_API_KEY or Whisper API failure.
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise ValueError(f"File not found: {file_path}")
-    if not path.is_file():
-        raise ValueError(f"Not a file: {file_path}")
+    path = _checked_path(file_path)
 
     api_key = get_openai_api_key()
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is not set")
 
     try:
-        client = OpenAI(api_key=api_key)
-        with open(path, "rb") as audio_file:
-            response = client.audio.transcriptions.create(
-                model=WHISPER_MODEL,
-                file=audio_file,
-            )
+        upload = _upload_file(path)
+    except OSError as e:
+        raise ValueError(f"Cannot read file: {file_path}") from e
+
+    try:
+        response = _get_client(api_key).audio.transcriptions.create(
+            model=WHISPER_MODEL,
+            file=upload,
+        )
         return response.text or ""
+    except Exception as e:
+        raise RuntimeError(f"Whisper API failed: {e}") from e
+    finally:
+        _close_upload(upload)
+
+
+async def transcribe_audio_async(file_path: str) -> str:
+    """
+    Async variant of transcribe_audio for use on the event loop.
+
+    The upload to Whisper is awaited instead of blocking the loop; only
+    hashing and re-encoding run in threads. Transcripts are cached in Redis
+    by audio content (see transcript_cache). Same arguments, result and errors.
+    """
+    path = _checked_path(file_path)
+
+    api_key = get_openai_api_key()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is not set")
+
+    try:
+        digest = await asyncio.to_thread(_hash_file, path)
+        cached = await transcript_cache.get_transcript(digest)
+        if cached is not None:
+            return cached
+        upload = await asyncio.to_thread(_upload_file, path)
     except OSError as e:
         raise ValueError(f"Cannot read file: {file_path}") from e
+
+    try:
+        response = await _get_async_client(api_key).audio.transcriptions.create(
+            model=WHISPER_MODEL,
+            file=upload,
+        )
     except Exception as e:
         raise RuntimeError(f"Whisper API failed: {e}") from e
+    finally:
+        _close_upload(upload)
+
+    transcript = response.text or ""
+    await transcript_cache.set_transcript(digest, transcript)
+    return transcript
+
+
+def _hash_file(path: Path) -> str:
+    """sha256 hex digest of a file, read in chunks (never whole in memory)."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _upload_file(path: Path) -> tuple[str, Union[bytes, BinaryIO]]:
+    """
+    (filename, content) to send to Whisper: compressed MP3 bytes when
+    worthwhile, else the original opened for streaming (never read whole
+    into memory). Release it with _close_upload.
+    """
+    compressed = audio_utils.compress_for_whisper(str(path), path.stat().st_size)
+    if compressed is None:
+        return path.name, open(path, "rb")
+    return f"{path.stem}.mp3", compressed
+
+
+def _close_upload(upload: tuple[str, Union[bytes, BinaryIO]]) -> None:
+    """Close the file opened by _upload_file, if any."""
+    content = upload[1]
+    if not isinstance(content, bytes):
+        content.close()
@@ -0,0 +1,99 @@
+"""
+Usage cache.
+
+Cache-aside layer over the MongoDB usage counter. Today's count is kept
+in Redis under usage:{user_id}:{yyyy-mm-dd}; writes go to MongoDB (source
+of truth) and then store the count they produced. Reads only fill an
+empty key (SET NX), so a slow read can't overwrite a newer count, and
+entries expire after CACHE_TTL_SECONDS to bound any reordering between
+concurrent writers.
+
+Falls back to MongoDB transparently when Redis is not configured or fails.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.db.connection import get_redis
+from app.db.models import Usage
+
+
+logger = logging.getLogger("speechi.cache")
+
+CACHE_TTL_SECONDS = 60
+
+
+def _cache_key(user_id: str, date: str) -> str:
+    """Redis key for a user's usage counter on date (yyyy-mm-dd)."""
+    return f"usage:{user_id}:{date}"
+
+
+def _cache_ttl() -> int:
+    """TTL for a cached counter: CACHE_TTL_SECONDS, cut short at UTC midnight."""
+    now = datetime.now(timezone.utc)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(1, min(CACHE_TTL_SECONDS, int((midnight - now).total_seconds())))
+
+
+async def get_usage(user_id: str) -> int:
+    """Get today's usage count, served from Redis when cached."""
+    redis = get_redis()
+    if redis is None:
+        return await Usage.get(user_id)
+
+    key = _cache_key(user_id, Usage._get_today())
+    try:
+        cached = await redis.get(key)
+        if cached is not None:
+            return int(cached)
+    except RedisError as e:
+        logger.warning("[CACHE] Redis GET failed, using MongoDB: %s", e)
+        return await Usage.get(user_id)
+
+    count = await Usage.get(user_id)
+    try:
+        # NX: a write that landed after our read has already stored a newer count
+        await redis.set(key, count, ex=_cache_ttl(), nx=True)
+    except RedisError as e:
+        logger.warning("[CACHE] Redis SET failed: %s", e)
+    return count
+
+
+async def reserve_usage(user_id: str, limit: int) -> Optional[str]:
+    """
+    Consume one use if under the limit (atomic in MongoDB).
+
+    Returns the date the use was charged to (pass it to release_usage),
+    or None if at the limit.
+    """
+    charged = await Usage.check_and_increment(user_id, limit)
+    if charged is None:
+        return None
+    count, date = charged
+    await _store_usage(user_id, date, count)
+    return date
+
+
+async def release_usage(user_id: str, date: str) -> None:
+    """Refund a use taken by reserve_usage on date (its return value)."""
+    count = await Usage.decrement(user_id, date)
+    await _store_usage(user_id, date, count)
+
+
+async def _store_usage(user_id: str, date: str, count: Optional[int]) -> None:
+    """Cache the count a MongoDB write returned (drop the key if unknown)."""
+    redis = get_redis()
+    if redis is None:
+        return
+
+    key = _cache_key(user_id, date)
+    try:
+        if count is None:
+            await redis.delete(key)
+        else:
+            await redis.setex(key, _cache_ttl(), count)
+    except RedisError as e:
+        logger.warning("[CACHE] Redis write failed: %s", e)
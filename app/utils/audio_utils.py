@@ -0,0 +1,60 @@
+"""
+Audio utilities.
+
+Re-encodes uploads to compact speech-quality MP3 before transcription so
+they upload faster and stay under Whisper's 25 MB limit for longer.
+Needs the ffmpeg binary; without it audio is sent as uploaded.
+"""
+
+import logging
+import shutil
+import subprocess
+from functools import cache
+from typing import Optional
+
+
+logger = logging.getLogger("speechi.audio")
+
+# Whisper resamples to 16 kHz mono internally, so nothing it uses is lost
+_FFMPEG_OUTPUT_ARGS = ("-vn", "-ac", "1", "-ar", "16000", "-b:a", "32k", "-f", "mp3", "pipe:1")
+# Below this the upload is already quick; not worth an ffmpeg run
+MIN_COMPRESS_BYTES = 2 << 20  # 2 MiB
+_FFMPEG_TIMEOUT_SECONDS = 300
+
+
+@cache
+def _ffmpeg() -> Optional[str]:
+    """Path of the ffmpeg binary, or None if not installed."""
+    return shutil.which("ffmpeg")
+
+
+def compress_for_whisper(path: str, size: int) -> Optional[bytes]:
+    """
+    Mono 16 kHz / 32 kbps MP3 of the audio file at path.
+
+    Args:
+        path: Audio file to re-encode.
+        size: Its size in bytes.
+
+    Returns:
+        The MP3 bytes, or None to send the original (small file, no ffmpeg,
+        ffmpeg failed, or the result is not smaller).
+    """
+    ffmpeg = _ffmpeg()
+    if ffmpeg is None or size < MIN_COMPRESS_BYTES:
+        return None
+
+    try:
+        proc = subprocess.run(
+            [ffmpeg, "-nostdin", "-v", "error", "-i", path, *_FFMPEG_OUTPUT_ARGS],
+            capture_output=True,
+            timeout=_FFMPEG_TIMEOUT_SECONDS,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning("[AUDIO] ffmpeg re-encode failed, sending original: %s", e)
+        return None
+
+    if not proc.stdout or len(proc.stdout) >= size:
+        return None
+    return proc.stdout
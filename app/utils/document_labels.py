@@ -5,6 +5,7 @@ Provides section headings for Word and PDF documents in all supported languages.
 RTL languages (Hebrew, Arabic) are marked for proper text direction handling.
 """
 
+from functools import lru_cache
 from typing import TypedDict
 
 
@@ -29,6 +30,7 @@ class DocumentLabels(TypedDict):
 RTL_LANGUAGES: frozenset[str] = frozenset({"he", "ar"})
 
 
+@lru_cache(maxsize=32)
 def is_rtl(language: str) -> bool:
     """Check if a language uses RTL text direction."""
     return language.lower() in RTL_LANGUAGES
@@ -114,6 +116,7 @@ DOCUMENT_LABELS: dict[str, DocumentLabels] = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_labels(language: str) -> DocumentLabels:
     """
     Get document labels for a specific language.
@@ -123,5 +126,6 @@ def get_labels(language: str) -> DocumentLabels:
         
     Returns:
         DocumentLabels for the specified language, defaults to English if not found.
+        The shared DOCUMENT_LABELS entry is returned; treat it as read-only.
     """
     return DOCUMENT_LABELS.get(language.lower(), DOCUMENT_LABELS["en"])
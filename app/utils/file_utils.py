@@ -9,6 +9,7 @@ import tempfile
 from pathlib import Path
 from typing import NamedTuple
 
+import anyio
 from fastapi import UploadFile
 
 # ============================================
@@ -38,6 +39,12 @@ ALLOWED_MIME_TYPES: frozenset[str] = frozenset(
     mime for mimes in ALLOWED_AUDIO_FORMATS.values() for mime in mimes
 )
 
+# Extensions as listed in the unsupported-format error (".aac, .flac, ...")
+_ALLOWED_EXTENSIONS_LIST = ", ".join(sorted(ALLOWED_EXTENSIONS))
+
+# Human-readable formats for API docs ("AAC, FLAC, ...")
+_SUPPORTED_FORMATS_STRING = ", ".join(ext.lstrip(".").upper() for ext in sorted(ALLOWED_EXTENSIONS))
+
 
 class AudioValidationResult(NamedTuple):
     """Result of audio file validation."""
@@ -63,10 +70,9 @@ def validate_audio_file(upload: UploadFile) -> AudioValidationResult:
     
     # Check extension
     if extension not in ALLOWED_EXTENSIONS:
-        allowed_list = ", ".join(sorted(ALLOWED_EXTENSIONS))
         return AudioValidationResult(
             valid=False,
-            error=f"Unsupported file format '{extension}'. Allowed formats: {allowed_list}",
+            error=f"Unsupported file format '{extension}'. Allowed formats: {_ALLOWED_EXTENSIONS_LIST}",
             extension=extension,
         )
     
@@ -83,13 +89,46 @@ def validate_audio_file(upload: UploadFile) -> AudioValidationResult:
 
 def get_supported_formats_string() -> str:
     """Return a human-readable string of supported audio formats."""
-    return ", ".join(ext.lstrip(".").upper() for ext in sorted(ALLOWED_EXTENSIONS))
+    return _SUPPORTED_FORMATS_STRING
 
 
 # ============================================
 # Temp File Operations
 # ============================================
 
+# Read/write granularity when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+async def stream_upload_to_temp(
+    upload: UploadFile,
+    suffix: str = ".mp3",
+    dir: str | None = None,
+) -> str:
+    """
+    Stream an uploaded file to a temporary file in 1 MiB chunks.
+
+    Memory use stays O(chunk) regardless of upload size.
+
+    Args:
+        upload: FastAPI UploadFile object.
+        suffix: File extension (e.g. .mp3, .wav). Default .mp3.
+        dir: Directory to create the file in. Default: system temp dir.
+
+    Returns:
+        Absolute path to the temporary file. Caller must delete via delete_temp_file.
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=dir)
+    try:
+        with open(fd, "wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                await anyio.to_thread.run_sync(f.write, chunk)
+    except Exception:
+        Path(path).unlink(missing_ok=True)
+        raise
+    return path
+
+
 def write_temp_audio(data: bytes, suffix: str = ".mp3") -> str:
     """
     Write bytes to a temporary audio file.
@@ -98,6 +137,20 @@ def write_temp_audio(data: bytes, suffix: str = ".mp3") -> str:
         data: Raw file content.
         suffix: File extension (e.g. .mp3, .wav). Default .mp3.
 
+    Returns:
+        Absolute path to the temporary file. Caller must delete via delete_temp_file.
+    """
+    return write_temp_file(data, suffix)
+
+
+def write_temp_file(data: bytes, suffix: str) -> str:
+    """
+    Write bytes to a new temporary file in one write.
+
+    Args:
+        data: Raw file content.
+        suffix: File extension (e.g. .docx, .pdf).
+
     Returns:
         Absolute path to the temporary file. Caller must delete via delete_temp_file.
     """
@@ -0,0 +1,24 @@
+"""
+Response helpers.
+
+orjson-backed JSON response for endpoints that return plain dicts/lists
+(no response_model). Endpoints with a response_model are already
+serialized to bytes by pydantic-core and don't need this.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Return it directly from the endpoint so FastAPI skips jsonable_encoder.
+    Naive datetimes serialize like datetime.isoformat() (no offset added).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
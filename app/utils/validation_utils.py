@@ -3,3 +3,35 @@ Validation utilities.
 
 Reusable checks for audio format, file size, and input constraints.
 """
+
+from functools import lru_cache
+from typing import Annotated
+
+from pydantic import AfterValidator, WithJsonSchema
+from pydantic.networks import validate_email
+
+
+@lru_cache(maxsize=1024)
+def normalize_email(value: str) -> str:
+    """Canonical (lowercase) form under which emails are stored and looked up."""
+    return value.lower()
+
+
+@lru_cache(maxsize=4096)
+def validate_email_cached(value: str) -> str:
+    """
+    Validate an email address and return its normalized form.
+
+    Same check as pydantic's EmailStr, lowercased via normalize_email and
+    memoized so repeat logins skip re-parsing the address. Invalid
+    addresses raise (and are not cached).
+    """
+    return normalize_email(validate_email(value)[1])
+
+
+# Drop-in replacement for EmailStr backed by validate_email_cached
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(validate_email_cached),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
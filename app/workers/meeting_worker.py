@@ -0,0 +1,150 @@
+"""
+Meeting processing worker (arq).
+
+Runs the Whisper → Claude → (optional) Word/PDF pipeline outside the
+request cycle. Jobs are queued by app.services.job_queue; results are
+stored in Redis for JOB_RESULT_TTL_SECONDS.
+
+Run with:
+    arq app.workers.meeting_worker.WorkerSettings
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from arq import cron
+
+from app.config.settings import settings
+from app.db.connection import close_db, init_db
+from app.services import (
+    document_service,
+    pdf_service,
+    summarization_service,
+    transcription_service,
+    usage_cache,
+)
+from app.services.job_queue import JOB_QUEUE_EXPIRY_SECONDS, job_storage_dir, redis_settings
+from app.utils import file_utils
+
+
+logger = logging.getLogger("speechi.worker")
+
+# Export format -> (renderer returning bytes, file extension)
+_EXPORTERS = {
+    "docx": (document_service.render_word_document, ".docx"),
+    "pdf": (pdf_service.render_pdf_document, ".pdf"),
+}
+_EXPORT_SUFFIXES = frozenset(ext for _, ext in _EXPORTERS.values())
+
+# Long recordings: transcription + chunked analysis can take many minutes
+JOB_TIMEOUT_SECONDS = 1800
+
+
+async def process_meeting_job(
+    ctx: dict,
+    audio_path: str,
+    language: str,
+    export: Optional[str],
+    user_id: Optional[str],
+    usage_date: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Transcribe, analyze and optionally export one meeting.
+
+    Transcription and analysis are async, so one worker can process
+    several jobs concurrently; only document rendering and the file write
+    run in a thread. The user's daily use was reserved on
+    submission (on usage_date) and is refunded on that day if the job fails.
+
+    Returns:
+        dict with transcript, analysis (dumped AnalysisResult), and
+        file/filename of the exported document (None if no export).
+    """
+    job_id = ctx["job_id"]
+    try:
+        return await _run_pipeline(job_id, audio_path, language, export)
+    except BaseException:
+        # Usage was consumed when the job was submitted; refund it. Jobs
+        # queued before usage_date was recorded can't tell which day to refund
+        if user_id and usage_date:
+            await usage_cache.release_usage(user_id, usage_date)
+        raise
+    finally:
+        file_utils.delete_temp_file(audio_path)
+
+
+async def _run_pipeline(
+    job_id: str,
+    audio_path: str,
+    language: str,
+    export: Optional[str],
+) -> dict[str, Any]:
+    """Transcribe → analyze → optional export."""
+    transcript = await transcription_service.transcribe_audio_async(audio_path)
+    analysis = await summarization_service.analyze_transcript_async(transcript, language)
+
+    file_path = None
+    filename = None
+    if export:
+        render, ext = _EXPORTERS[export]
+        content = await asyncio.to_thread(render, analysis, language)
+        file_path = str(Path(job_storage_dir()) / f"{job_id}{ext}")
+        await asyncio.to_thread(Path(file_path).write_bytes, content)
+        filename = f"meeting_summary_{language}{ext}"
+
+    return {
+        "transcript": transcript,
+        "analysis": analysis.model_dump(),
+        "file": file_path,
+        "filename": filename,
+    }
+
+
+async def cleanup_job_files(ctx: dict) -> None:
+    """
+    Delete job files that nothing can use any more.
+
+    Exports go once their job result (and with it the download) has
+    expired. Uploads are deleted by the job itself; the sweep only removes
+    ones left behind (worker crash, job expired unstarted), once they are
+    older than any job could still be queued or running.
+    """
+    now = time.time()
+    export_cutoff = now - settings.job_result_ttl_seconds
+    upload_cutoff = now - JOB_QUEUE_EXPIRY_SECONDS - JOB_TIMEOUT_SECONDS
+    for path in Path(job_storage_dir()).iterdir():
+        cutoff = export_cutoff if path.suffix in _EXPORT_SUFFIXES else upload_cutoff
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError as e:
+            logger.warning("[WORKER] Failed to remove %s: %s", path, e)
+
+
+async def startup(ctx: dict) -> None:
+    """Connect MongoDB/Redis (usage tracking) and preload WeasyPrint when the worker starts."""
+    pdf_service.warm_up()
+    await init_db()
+
+
+async def shutdown(ctx: dict) -> None:
+    """Close connections when the worker stops."""
+    await close_db()
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [process_meeting_job]
+    cron_jobs = [cron(cleanup_job_files, minute=set(range(0, 60, 10)))]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = redis_settings()
+    max_jobs = settings.worker_max_jobs
+    keep_result = settings.job_result_ttl_seconds
+    job_timeout = JOB_TIMEOUT_SECONDS
+    # Paid API calls and the upload is consumed; never retry automatically
+    max_tries = 1